@@ -10,6 +10,7 @@ from physics_ai.types import (
     PaperBuildSpec,
     PerturbationSystem,
     ProposalSpec,
+    QNMBatch,
     QNMRunConfig,
     QNMResult,
     ScanJob,
@@ -29,6 +30,7 @@ __all__ = [
     "PaperBuildSpec",
     "PerturbationSystem",
     "ProposalSpec",
+    "QNMBatch",
     "QNMRunConfig",
     "QNMResult",
     "ScanJob",
@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+log = logging.getLogger(__name__)
+
 
 def write_dataframe(df: pd.DataFrame, preferred_path: Path) -> Path:
     preferred_path.parent.mkdir(parents=True, exist_ok=True)
     if preferred_path.suffix != ".parquet":
         preferred_path = preferred_path.with_suffix(".parquet")
-    try:
-        df.to_parquet(preferred_path, index=False)
-        return preferred_path
-    except Exception:
-        fallback = preferred_path.with_suffix(".csv")
-        df.to_csv(fallback, index=False)
-        return fallback
+    if pa is not None and pq is not None:
+        try:
+            # Scan outputs repeat parameter/method values heavily, so dictionary
+            # encoding + zstd is much smaller than the pandas snappy default.
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                preferred_path,
+                compression="zstd",
+                compression_level=3,
+                use_dictionary=True,
+                write_statistics=True,
+                row_group_size=64 * 1024,
+            )
+            return preferred_path
+        except (pa.ArrowException, OSError):
+            log.warning("Parquet write to %s failed; falling back to CSV", preferred_path, exc_info=True)
+    fallback = preferred_path.with_suffix(".csv")
+    df.to_csv(fallback, index=False)
+    return fallback
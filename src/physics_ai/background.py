@@ -4,6 +4,27 @@ import sympy as sp
 
 from physics_ai.types import BackgroundSystem, DerivationArtifact, TheorySpec
 
+# The reduced equations are purely structural (they do not depend on theory
+# parameters), so the SymPy trees and their string forms are built once at import.
+_r = sp.Symbol("r", positive=True)
+_A = sp.Function("A")
+_B = sp.Function("B")
+_rho = sp.Function("rho")
+_pr = sp.Function("p_r")
+_C = sp.Function("C")
+
+_EQ_B = sp.Eq(sp.diff(_B(_r), _r), (1 - sp.exp(2 * _B(_r))) / (2 * _r) + 4 * sp.pi * _r * _rho(_r))
+_EQ_A = sp.Eq(sp.diff(_A(_r), _r), (sp.exp(2 * _B(_r)) - 1) / (2 * _r) + 4 * sp.pi * _r * _pr(_r))
+_EQ_FR_SCALAR = sp.Eq(
+    sp.diff(_C(_r), _r, 2) + 2 / _r * sp.diff(_C(_r), _r),
+    sp.Function("source_fr")(_r),
+)
+
+_EQ_STR_BASE: tuple[str, ...] = (str(_EQ_B), str(_EQ_A))
+_EQ_STR_FR: tuple[str, ...] = (*_EQ_STR_BASE, str(_EQ_FR_SCALAR))
+_UNKNOWNS_BASE: tuple[str, ...] = ("A(r)", "B(r)")
+_UNKNOWNS_FR: tuple[str, ...] = (*_UNKNOWNS_BASE, "C(r)")
+
 
 def static_spherical_ansatz() -> dict[str, str]:
     return {
@@ -13,24 +34,11 @@ def static_spherical_ansatz() -> dict[str, str]:
 
 
 def reduce_to_background_odes(theory: TheorySpec, artifact: DerivationArtifact, run_id: str) -> BackgroundSystem:
-    r = sp.Symbol("r", positive=True)
-    A = sp.Function("A")
-    B = sp.Function("B")
-    rho = sp.Function("rho")
-    pr = sp.Function("p_r")
-
-    eq1 = sp.Eq(sp.diff(B(r), r), (1 - sp.exp(2 * B(r))) / (2 * r) + 4 * sp.pi * r * rho(r))
-    eq2 = sp.Eq(sp.diff(A(r), r), (sp.exp(2 * B(r)) - 1) / (2 * r) + 4 * sp.pi * r * pr(r))
-
     family = artifact.metadata.get("family", "generic")
     if family == "f(R)":
-        C = sp.Function("C")
-        eq3 = sp.Eq(sp.diff(C(r), r, 2) + 2 / r * sp.diff(C(r), r), sp.Symbol("source_fr")(r))
-        equations = [str(eq1), str(eq2), str(eq3)]
-        unknowns = ["A(r)", "B(r)", "C(r)"]
+        equations, unknowns = _EQ_STR_FR, _UNKNOWNS_FR
     else:
-        equations = [str(eq1), str(eq2)]
-        unknowns = ["A(r)", "B(r)"]
+        equations, unknowns = _EQ_STR_BASE, _UNKNOWNS_BASE
 
     consistency = {
         "equation_count": len(equations),
@@ -42,8 +50,8 @@ def reduce_to_background_odes(theory: TheorySpec, artifact: DerivationArtifact,
         run_id=run_id,
         theory_name=theory.name,
         ansatz="static_spherical",
-        unknown_functions=unknowns,
-        reduced_equations=equations,
+        unknown_functions=list(unknowns),
+        reduced_equations=list(equations),
         consistency=consistency,
     )
 
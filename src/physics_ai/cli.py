@@ -1,28 +1,26 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Optional
 
-import pandas as pd
 import typer
 
-from physics_ai.artifacts import write_dataframe
-from physics_ai.background import reduce_to_background_odes
-from physics_ai.distributed import run_scan_distributed
-from physics_ai.explore import run_scan, save_stability_plot, summarize_scan
+# SymPy, pandas, matplotlib, httpx and dask are imported inside the commands that
+# need them so that light subcommands start quickly.
 from physics_ai.hpc import SlurmJobSpec, write_slurm_script
-from physics_ai.novelty import default_seed_records, score_novelty
-from physics_ai.orchestrate import run_autonomous_campaign, run_autonomous_daemon
 from physics_ai.paper import build_paper
-from physics_ai.perturbation import derive_master_equation
-from physics_ai.qnm import solve_qnm
-from physics_ai.symbolic import derive_field_equations, verify_fr_baseline, verify_gr_baseline
-from physics_ai.theory import load_theory, validate_theory
-from physics_ai.types import CampaignSpec, Method, PaperBuildSpec, QNMRunConfig, ScanJob
-from physics_ai.utils import generate_run_id, load_yaml_or_json
+from physics_ai.theory import load_campaign, load_scan_job, load_theory, validate_theory
+from physics_ai.types import (
+    BackgroundSystem,
+    Method,
+    NoveltyReport,
+    PaperBuildSpec,
+    QNMRunConfig,
+)
+from physics_ai.utils import generate_run_id, json_bytes, load_yaml_or_json
 
 
+ARTIFACT_ROOT = Path("artifacts")
+
 app = typer.Typer(help="Autonomous theoretical physics research engine.")
 theory_app = typer.Typer(help="Theory schema operations.")
 derive_app = typer.Typer(help="Derivation operations.")
@@ -48,13 +46,15 @@ def theory_validate(theory_path: Path) -> None:
 
 
 @derive_app.command("eom")
-def derive_eom(theory_path: Path, run_id: Optional[str] = typer.Option(None)) -> None:
+def derive_eom(theory_path: Path, run_id: str | None = typer.Option(None)) -> None:
+    from physics_ai.symbolic import derive_field_equations, verify_fr_baseline, verify_gr_baseline
+
     run_id = run_id or generate_run_id("derive")
-    theory = load_theory(theory_path)
+    theory = load_theory(theory_path, trusted=True)
     artifact = derive_field_equations(theory, run_id=run_id)
-    output = Path("artifacts") / run_id / "derive" / "eom.json"
+    output = ARTIFACT_ROOT / run_id / "derive" / "eom.json"
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(artifact.model_dump(mode="json"), indent=2), encoding="utf-8")
+    output.write_bytes(json_bytes(artifact.to_dict()))
 
     checks = []
     family = artifact.metadata.get("family")
@@ -69,33 +69,34 @@ def derive_eom(theory_path: Path, run_id: Optional[str] = typer.Option(None)) ->
 def derive_background(
     theory_path: Path,
     ansatz: str = typer.Option("static_spherical"),
-    run_id: Optional[str] = typer.Option(None),
+    run_id: str | None = typer.Option(None),
 ) -> None:
+    from physics_ai.background import reduce_to_background_odes
+    from physics_ai.symbolic import derive_field_equations
+
     if ansatz != "static_spherical":
         raise typer.BadParameter("Only static_spherical is implemented in this baseline.")
     run_id = run_id or generate_run_id("background")
-    theory = load_theory(theory_path)
+    theory = load_theory(theory_path, trusted=True)
     derivation = derive_field_equations(theory, run_id=run_id)
     background = reduce_to_background_odes(theory, derivation, run_id=run_id)
-    output = Path("artifacts") / run_id / "background" / "background.json"
+    output = ARTIFACT_ROOT / run_id / "background" / "background.json"
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(background.model_dump(mode="json"), indent=2), encoding="utf-8")
+    output.write_bytes(json_bytes(background.to_dict()))
     typer.echo(f"Wrote {output}")
 
 
 @derive_app.command("perturb")
-def derive_perturb(background_id: Path, run_id: Optional[str] = typer.Option(None)) -> None:
-    run_id = run_id or generate_run_id("perturb")
-    payload = load_yaml_or_json(background_id)
-    theory_name = payload.get("theory_name", "unknown")
-    from physics_ai.types import BackgroundSystem
+def derive_perturb(background_id: Path, run_id: str | None = typer.Option(None)) -> None:
+    from physics_ai.perturbation import derive_master_equation
 
-    background = BackgroundSystem.model_validate(payload)
+    run_id = run_id or generate_run_id("perturb")
+    background = BackgroundSystem.from_dict(load_yaml_or_json(background_id))
     perturb = derive_master_equation(background, run_id=run_id)
-    output = Path("artifacts") / run_id / "perturb" / "perturbation.json"
+    output = ARTIFACT_ROOT / run_id / "perturb" / "perturbation.json"
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(perturb.model_dump(mode="json"), indent=2), encoding="utf-8")
-    typer.echo(f"Wrote {output} for {theory_name}")
+    output.write_bytes(json_bytes(perturb.to_dict()))
+    typer.echo(f"Wrote {output} for {background.theory_name}")
 
 
 @run_app.command("qnm")
@@ -105,27 +106,49 @@ def run_qnm(
     l: int = typer.Option(2),
     n: int = typer.Option(0),
     mass: float = typer.Option(1.0),
-    run_id: Optional[str] = typer.Option(None),
+    run_id: str | None = typer.Option(None),
 ) -> None:
+    from physics_ai.qnm import solve_qnm
+
     run_id = run_id or generate_run_id("qnm")
     _ = load_yaml_or_json(perturb_id)
     config = QNMRunConfig(l=l, n=n, mass=mass, method=method)
     result = solve_qnm(config, run_id=run_id, method=method)
-    output = Path("artifacts") / run_id / "qnm" / f"qnm_{method.value}.json"
+    output = ARTIFACT_ROOT / run_id / "qnm" / f"qnm_{method.value}.json"
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(result.model_dump(mode="json"), indent=2), encoding="utf-8")
+    output.write_bytes(json_bytes(result.to_dict()))
     typer.echo(f"Wrote {output}")
 
 
 @run_app.command("scan")
-def run_scan_cmd(scan_path: Path, distributed: bool = typer.Option(False), workers: int = typer.Option(2)) -> None:
-    payload = load_yaml_or_json(scan_path)
-    job = ScanJob.model_validate(payload)
-    df = run_scan_distributed(job, workers=workers) if distributed else run_scan(job)
-    out_dir = Path("artifacts") / job.run_id / "scan"
+def run_scan_cmd(
+    scan_path: Path,
+    distributed: bool = typer.Option(False),
+    workers: int = typer.Option(2),
+    shard: int = typer.Option(0, help="Index of the grid shard to run (e.g. $SLURM_ARRAY_TASK_ID)."),
+    shards: int = typer.Option(1, help="Total number of grid shards."),
+) -> None:
+    import pandas as pd
+
+    from physics_ai.artifacts import write_dataframe
+    from physics_ai.explore import run_scan, save_stability_plot, summarize_scan
+
+    if shards < 1 or not 0 <= shard < shards:
+        raise typer.BadParameter("Require 0 <= --shard < --shards.")
+    if distributed and shards > 1:
+        raise typer.BadParameter("--distributed cannot be combined with --shards.")
+    job = load_scan_job(scan_path)
+    if distributed:
+        from physics_ai.distributed import run_scan_distributed
+
+        df = run_scan_distributed(job, workers=workers)
+    else:
+        df = run_scan(job, workers=workers, shard=shard, shards=shards)
+    out_dir = ARTIFACT_ROOT / job.run_id / "scan"
     out_dir.mkdir(parents=True, exist_ok=True)
-    parquet_path = out_dir / "scan.parquet"
-    plot_path = out_dir / "stability.png"
+    suffix = f"_shard{shard:04d}" if shards > 1 else ""
+    parquet_path = out_dir / f"scan{suffix}.parquet"
+    plot_path = out_dir / f"stability{suffix}.png"
     if df.empty:
         df = pd.DataFrame(columns=["omega_real", "omega_imag", "constraints_valid"])
     written_data_path = write_dataframe(df, parquet_path)
@@ -134,8 +157,8 @@ def run_scan_cmd(scan_path: Path, distributed: bool = typer.Option(False), worke
         save_stability_plot(df, plot_path)
     summary = summarize_scan(df)
     summary["scan_file"] = str(written_data_path)
-    summary_path = out_dir / "summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    summary_path = out_dir / f"summary{suffix}.json"
+    summary_path.write_bytes(json_bytes(summary))
     typer.echo(f"Wrote {written_data_path} and {summary_path}")
 
 
@@ -143,14 +166,23 @@ def run_scan_cmd(scan_path: Path, distributed: bool = typer.Option(False), worke
 def run_slurm_template(
     command: str = typer.Option("physai run scan examples/scan.yaml"),
     output: Path = typer.Option(Path("examples/campaigns/scan_job.slurm")),
+    array_size: int = typer.Option(0, help="Emit a job array with this many grid shards (0 disables)."),
+    array_concurrency: int = typer.Option(0, help="Max array tasks running at once (0 means no limit)."),
 ) -> None:
-    spec = SlurmJobSpec(job_name="physai_scan", command=command)
+    spec = SlurmJobSpec(
+        job_name="physai_scan",
+        command=command,
+        array_size=array_size,
+        array_concurrency=array_concurrency,
+    )
     path = write_slurm_script(spec, output)
     typer.echo(f"Wrote {path}")
 
 
 @novelty_app.command("score")
-def novelty_score(run_id: str, equations_path: Optional[Path] = typer.Option(None)) -> None:
+def novelty_score(run_id: str, equations_path: Path | None = typer.Option(None)) -> None:
+    from physics_ai.novelty import default_seed_records, score_novelty
+
     equations = ["d2Psi/dr_*2 + (omega^2 - V)Psi = 0"]
     if equations_path:
         payload = load_yaml_or_json(equations_path)
@@ -162,9 +194,9 @@ def novelty_score(run_id: str, equations_path: Optional[Path] = typer.Option(Non
         parameters={"mass": 1.0},
         corpus=default_seed_records(),
     )
-    out = Path("artifacts") / run_id / "novelty" / "novelty.json"
+    out = ARTIFACT_ROOT / run_id / "novelty" / "novelty.json"
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(report.model_dump(mode="json"), indent=2), encoding="utf-8")
+    out.write_bytes(json_bytes(report.model_dump(mode="json")))
     typer.echo(f"Wrote {out}")
 
 
@@ -172,9 +204,9 @@ def novelty_score(run_id: str, equations_path: Optional[Path] = typer.Option(Non
 def paper_build(
     run_id: str,
     title: str = typer.Option("Autonomous Physics AI Report"),
-    output_dir: Optional[Path] = typer.Option(None),
+    output_dir: Path | None = typer.Option(None),
 ) -> None:
-    out = output_dir or (Path("artifacts") / run_id / "paper")
+    out = output_dir or (ARTIFACT_ROOT / run_id / "paper")
     spec = PaperBuildSpec(
         run_id=run_id,
         title=title,
@@ -183,10 +215,12 @@ def paper_build(
         include_latex=True,
         include_markdown=True,
     )
-    novelty_payload = {"run_id": run_id, "novelty_score": 0.4, "explanation": "Seed novelty report", "neighbors": []}
-    from physics_ai.types import NoveltyReport
-
-    novelty = NoveltyReport.model_validate(novelty_payload)
+    novelty = NoveltyReport.model_construct(
+        run_id=run_id,
+        novelty_score=0.4,
+        explanation="Seed novelty report",
+        neighbors=[],
+    )
     outputs = build_paper(
         spec,
         derivation={"family": "GR", "equations": ["Eq(G(mu,nu),kappa*T(mu,nu))"]},
@@ -198,15 +232,17 @@ def paper_build(
 
 @orchestrate_app.command("autonomous")
 def orchestrate_autonomous(
-    campaign: Optional[Path] = typer.Argument(None, help="Path to campaign YAML/JSON."),
-    campaign_path: Optional[Path] = typer.Option(None, "--campaign", help="Path to campaign YAML/JSON."),
+    campaign: Path | None = typer.Argument(None, help="Path to campaign YAML/JSON."),
+    campaign_path: Path | None = typer.Option(None, "--campaign", help="Path to campaign YAML/JSON."),
+    workers: int | None = typer.Option(None, help="Proposal worker processes; defaults to the CPU count."),
 ) -> None:
+    from physics_ai.orchestrate import run_autonomous_campaign
+
     selected_campaign = campaign_path or campaign
     if selected_campaign is None:
         raise typer.BadParameter("Provide CAMPAIGN positional argument or --campaign <path>.")
-    payload = load_yaml_or_json(selected_campaign)
-    campaign_spec = CampaignSpec.model_validate(payload)
-    result = run_autonomous_campaign(campaign_spec)
+    campaign_spec = load_campaign(selected_campaign)
+    result = run_autonomous_campaign(campaign_spec, workers=workers)
     typer.echo(
         "Campaign complete "
         f"run_id={result.run_id} accepted={result.accepted_theories} rejected={result.rejected_theories}"
@@ -217,19 +253,21 @@ def orchestrate_autonomous(
 
 @orchestrate_app.command("daemon")
 def orchestrate_daemon(
-    campaign: Optional[Path] = typer.Argument(None, help="Path to campaign YAML/JSON."),
-    campaign_path: Optional[Path] = typer.Option(None, "--campaign", help="Path to campaign YAML/JSON."),
+    campaign: Path | None = typer.Argument(None, help="Path to campaign YAML/JSON."),
+    campaign_path: Path | None = typer.Option(None, "--campaign", help="Path to campaign YAML/JSON."),
     hours: float = typer.Option(24.0, help="Total runtime budget in hours."),
     sleep_seconds: int = typer.Option(120, help="Pause between campaign cycles."),
     max_cycles: int = typer.Option(0, help="Optional cycle cap; 0 means unlimited."),
-    proposal_count: Optional[int] = typer.Option(None, help="Override proposals per cycle."),
+    proposal_count: int | None = typer.Option(None, help="Override proposals per cycle."),
+    workers: int | None = typer.Option(None, help="Proposal worker processes; defaults to the CPU count."),
 ) -> None:
+    from physics_ai.orchestrate import run_autonomous_daemon
+
     selected_campaign = campaign_path or campaign
     if selected_campaign is None:
         raise typer.BadParameter("Provide CAMPAIGN positional argument or --campaign <path>.")
 
-    payload = load_yaml_or_json(selected_campaign)
-    campaign_spec = CampaignSpec.model_validate(payload)
+    campaign_spec = load_campaign(selected_campaign)
     cycle_cap = max_cycles if max_cycles > 0 else None
     result = run_autonomous_daemon(
         campaign_spec,
@@ -237,6 +275,7 @@ def orchestrate_daemon(
         sleep_seconds=sleep_seconds,
         max_cycles=cycle_cap,
         proposal_count=proposal_count,
+        workers=workers,
     )
     typer.echo(
         "Daemon complete "
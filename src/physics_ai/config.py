@@ -8,6 +8,7 @@ from pathlib import Path
 @dataclass(frozen=True)
 class Settings:
     artifact_root: Path = Path(os.getenv("PHYSAI_ARTIFACT_ROOT", "artifacts"))
+    artifact_archive: bool = os.getenv("PHYSAI_ARTIFACT_ARCHIVE", "0") == "1"
     database_url: str = os.getenv("PHYSAI_DATABASE_URL", "sqlite:///physai.db")
     faiss_index_dir: Path = Path(os.getenv("PHYSAI_FAISS_INDEX_DIR", "artifacts/faiss"))
     llm_base_url: str = os.getenv("PHYSAI_LLM_BASE_URL", "https://integrate.api.nvidia.com/v1")
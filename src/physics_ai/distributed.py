@@ -1,56 +1,53 @@
 from __future__ import annotations
 
-import itertools
 from typing import Any
 
 import pandas as pd
 
-from physics_ai.explore import run_scan
-from physics_ai.physics_rules import evaluate_constraints
-from physics_ai.qnm import compare_methods, solve_qnm
-from physics_ai.types import QNMRunConfig, ScanJob
+from physics_ai.explore import iter_parameter_points, run_scan, scan_one_point
+from physics_ai.types import ScanJob
 
 try:
-    from dask.distributed import Client, LocalCluster  # type: ignore
+    from dask.distributed import Client, LocalCluster, as_completed  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
-    Client = None
-    LocalCluster = None
+    Client = None  # type: ignore[misc,assignment]
+    LocalCluster = None  # type: ignore[misc,assignment]
+    as_completed = None  # type: ignore[misc,assignment]
+
+
+def _scan_task(point: dict[str, float], job: ScanJob) -> dict[str, Any]:
+    batch, disagreement, constraints_valid = scan_one_point(job, point)
+    return {
+        **point,
+        "avg_real": float(batch.omega_real.mean()),
+        "avg_imag": float(batch.omega_imag.mean()),
+        "disagreement_real": disagreement.max_abs_delta_real,
+        "disagreement_imag": disagreement.max_abs_delta_imag,
+        "constraints_valid": constraints_valid,
+    }
 
 
 def run_scan_distributed(job: ScanJob, workers: int = 2) -> pd.DataFrame:
     if Client is None or LocalCluster is None:
         return run_scan(job)
 
-    keys = list(job.parameter_grid)
-    points = [dict(zip(keys, combo)) for combo in itertools.product(*[job.parameter_grid[k] for k in keys])]
+    points = iter_parameter_points(job.parameter_grid)
     if not points:
         return run_scan(job)
 
-    def task(point: dict[str, float]) -> dict[str, Any]:
-        theory = job.theory.model_copy(deep=True)
-        theory.parameters.update({k: float(v) for k, v in point.items()})
-        results = []
-        for l in job.l_values:
-            for n in job.n_values:
-                config = QNMRunConfig(l=l, n=n, mass=theory.parameters.get("mass", 1.0))
-                for method in job.methods:
-                    results.append(solve_qnm(config=config, run_id=job.run_id, method=method))
-        disagreement = compare_methods(results)
-        constraints = evaluate_constraints(job.run_id, theory, qnm_results=results)
-        return {
-            **point,
-            "avg_real": float(sum(r.omega_real for r in results) / len(results)),
-            "avg_imag": float(sum(r.omega_imag for r in results) / len(results)),
-            "disagreement_real": disagreement.max_abs_delta_real,
-            "disagreement_imag": disagreement.max_abs_delta_imag,
-            "constraints_valid": constraints.is_valid,
-        }
-
     cluster = LocalCluster(n_workers=workers, threads_per_worker=1)
     client = Client(cluster)
     try:
-        futures = client.map(task, points)
-        rows = client.gather(futures)
+        # Ship the job to every worker once instead of pickling it into each task.
+        job_future = client.scatter(job, broadcast=True)
+        # pure=False: duplicate grid points must stay distinct tasks with distinct keys,
+        # or they would share (and prematurely release) one result.
+        futures = [client.submit(_scan_task, point, job_future, pure=False) for point in points]
+        positions = {future.key: index for index, future in enumerate(futures)}
+        rows: list[dict[str, Any]] = [{} for _ in points]
+        for future in as_completed(futures):
+            rows[positions[future.key]] = future.result()
+            future.release()
         return pd.DataFrame(rows)
     finally:
         client.close()
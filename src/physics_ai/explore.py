@@ -1,69 +1,143 @@
 from __future__ import annotations
 
-import itertools
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from physics_ai.physics_rules import evaluate_constraints
-from physics_ai.qnm import compare_methods, solve_qnm, spectrum_table
-from physics_ai.types import QNMRunConfig, ScanJob
+from physics_ai.qnm import DisagreementReport, compare_methods, solve_qnm_batch
+from physics_ai.types import QNMBatch, QNMRunConfig, ScanJob
+from physics_ai.utils import worker_context
 
 
-def _iter_parameter_points(grid: dict[str, list[float]]) -> list[dict[str, float]]:
+def _parameter_columns(grid: dict[str, list[float]]) -> dict[str, np.ndarray]:
+    # One flat array per key; 'ij' indexing + C-order ravel matches itertools.product order.
     if not grid:
-        return [{}]
+        return {}
     keys = list(grid)
-    values = [grid[key] for key in keys]
-    points = []
-    for combo in itertools.product(*values):
-        points.append({key: float(value) for key, value in zip(keys, combo)})
-    return points
-
-
-def run_scan(job: ScanJob) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    points = _iter_parameter_points(job.parameter_grid)
-    for point in points:
-        working_theory = job.theory.model_copy(deep=True)
-        working_theory.parameters.update(point)
-
-        results = []
-        for l in job.l_values:
-            for n in job.n_values:
-                base_config = QNMRunConfig(l=l, n=n, mass=working_theory.parameters.get("mass", 1.0))
-                for method in job.methods:
-                    results.append(solve_qnm(base_config, run_id=job.run_id, method=method))
-
-        disagreement = compare_methods(results)
-        constraints = evaluate_constraints(job.run_id, working_theory, qnm_results=results)
-        table = spectrum_table(results)
-        for key, value in point.items():
-            table[key] = value
-        table["constraints_valid"] = constraints.is_valid
-        table["disagreement_real"] = disagreement.max_abs_delta_real
-        table["disagreement_imag"] = disagreement.max_abs_delta_imag
-        frames.append(table)
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    mesh = np.meshgrid(*[np.asarray(grid[key], dtype=np.float64) for key in keys], indexing="ij")
+    return {key: axis.ravel() for key, axis in zip(keys, mesh)}
+
+
+def _point_count(columns: dict[str, np.ndarray]) -> int:
+    return len(next(iter(columns.values()))) if columns else 1
+
+
+def _points_from_columns(columns: dict[str, np.ndarray]) -> list[dict[str, float]]:
+    return [
+        {key: float(column[index]) for key, column in columns.items()}
+        for index in range(_point_count(columns))
+    ]
+
+
+def iter_parameter_points(grid: dict[str, list[float]]) -> list[dict[str, float]]:
+    return _points_from_columns(_parameter_columns(grid))
+
+
+def scan_one_point(job: ScanJob, point: dict[str, float]) -> tuple[QNMBatch, DisagreementReport, bool]:
+    # Shallow copy: only the parameter mapping differs between grid points.
+    working_theory = job.theory.model_copy(update={"parameters": {**job.theory.parameters, **point}})
+
+    mass = working_theory.parameters.get("mass", 1.0)
+    configs = [QNMRunConfig(l=l, n=n, mass=mass) for l in job.l_values for n in job.n_values]
+    results = []
+    for method in job.methods:
+        results.extend(solve_qnm_batch(configs, run_id=job.run_id, method=method))
+
+    batch = QNMBatch.from_results(results)
+    disagreement = compare_methods(batch)
+    constraints = evaluate_constraints(job.run_id, working_theory, qnm_results=batch)
+    return batch, disagreement, constraints.is_valid
+
+
+def run_scan(job: ScanJob, workers: int = 1, shard: int = 0, shards: int = 1) -> pd.DataFrame:
+    """Solve every grid point (or every ``shards``-th one, starting at ``shard``).
+
+    Points run in-process unless ``workers > 1``, in which case they are spread over
+    a process pool of that size.
+    """
+    if shards < 1 or not 0 <= shard < shards:
+        raise ValueError(f"invalid shard {shard} of {shards}")
+    columns = _parameter_columns(job.parameter_grid)
+    points = _points_from_columns(columns)[shard::shards]
+    columns = {key: column[shard::shards] for key, column in columns.items()}
+    if workers <= 1 or len(points) <= 1:
+        outcomes = [scan_one_point(job, point) for point in points]
+    else:
+        workers = min(workers, len(points))
+        chunksize = max(1, len(points) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+            outcomes = list(executor.map(scan_one_point, repeat(job), points, chunksize=chunksize))
+
+    # Every point yields the same (method, l, n) block, so all columns are sized
+    # up front and filled in place; the DataFrame is built once at the end.
+    per_point = len(job.methods) * len(job.l_values) * len(job.n_values)
+    total = len(points) * per_point
+    if total == 0:
+        return pd.DataFrame()
+    method = np.empty(total, dtype=object)
+    l_col = np.empty(total, dtype=np.int64)
+    n_col = np.empty(total, dtype=np.int64)
+    omega_real = np.empty(total, dtype=np.float64)
+    omega_imag = np.empty(total, dtype=np.float64)
+    constraints_valid = np.empty(len(points), dtype=bool)
+    disagreement_real = np.empty(len(points), dtype=np.float64)
+    disagreement_imag = np.empty(len(points), dtype=np.float64)
+
+    for index, (batch, disagreement, is_valid) in enumerate(outcomes):
+        block = slice(index * per_point, (index + 1) * per_point)
+        method[block] = batch.method_values()
+        l_col[block] = batch.l
+        n_col[block] = batch.n
+        omega_real[block] = batch.omega_real
+        omega_imag[block] = batch.omega_imag
+        constraints_valid[index] = is_valid
+        disagreement_real[index] = disagreement.max_abs_delta_real
+        disagreement_imag[index] = disagreement.max_abs_delta_imag
+
+    data: dict[str, np.ndarray] = {
+        "run_id": np.full(total, job.run_id, dtype=object),
+        "method": method,
+        "l": l_col,
+        "n": n_col,
+        "omega_real": omega_real,
+        "omega_imag": omega_imag,
+    }
+    for key, column in columns.items():
+        data[key] = np.repeat(column, per_point)
+    data["constraints_valid"] = np.repeat(constraints_valid, per_point)
+    data["disagreement_real"] = np.repeat(disagreement_real, per_point)
+    data["disagreement_imag"] = np.repeat(disagreement_imag, per_point)
+    return pd.DataFrame(data)
 
 
 def save_stability_plot(df: pd.DataFrame, output: str | Path) -> Path:
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
     path = Path(output)
     path.parent.mkdir(parents=True, exist_ok=True)
-    fig, ax = plt.subplots(figsize=(7, 4))
-    valid = df[df["constraints_valid"] == True]  # noqa: E712
-    invalid = df[df["constraints_valid"] == False]  # noqa: E712
-    ax.scatter(valid["omega_real"], valid["omega_imag"], s=20, c="green", label="valid")
-    ax.scatter(invalid["omega_real"], invalid["omega_imag"], s=20, c="red", label="filtered")
+    # A bare Figure renders through Agg without touching the pyplot backend or
+    # its global figure registry, so repeated scans do not accumulate figures.
+    fig = Figure(figsize=(7, 4))
+    ax = fig.subplots()
+    colors = np.where(df["constraints_valid"].to_numpy(dtype=bool), "green", "red")
+    ax.scatter(df["omega_real"].to_numpy(), df["omega_imag"].to_numpy(), s=20, c=colors)
     ax.set_xlabel("Re(omega)")
     ax.set_ylabel("Im(omega)")
     ax.set_title("QNM stability map")
-    ax.legend()
+    ax.legend(
+        handles=[
+            Line2D([], [], marker="o", linestyle="", color="green", label="valid"),
+            Line2D([], [], marker="o", linestyle="", color="red", label="filtered"),
+        ]
+    )
     fig.tight_layout()
     fig.savefig(path)
-    plt.close(fig)
     return path
 
 
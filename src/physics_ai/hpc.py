@@ -13,23 +13,27 @@ class SlurmJobSpec:
     cpus_per_task: int = 4
     mem_gb: int = 16
     time_limit: str = "02:00:00"
+    array_size: int = 0
+    array_concurrency: int = 0
 
 
 def render_slurm_script(spec: SlurmJobSpec) -> str:
-    return "\n".join(
-        [
-            "#!/bin/bash",
-            f"#SBATCH --job-name={spec.job_name}",
-            f"#SBATCH --partition={spec.partition}",
-            f"#SBATCH --gpus={spec.gpus}",
-            f"#SBATCH --cpus-per-task={spec.cpus_per_task}",
-            f"#SBATCH --mem={spec.mem_gb}G",
-            f"#SBATCH --time={spec.time_limit}",
-            "",
-            "set -euo pipefail",
-            spec.command,
-        ]
-    )
+    lines = [
+        "#!/bin/bash",
+        f"#SBATCH --job-name={spec.job_name}",
+        f"#SBATCH --partition={spec.partition}",
+        f"#SBATCH --gpus={spec.gpus}",
+        f"#SBATCH --cpus-per-task={spec.cpus_per_task}",
+        f"#SBATCH --mem={spec.mem_gb}G",
+        f"#SBATCH --time={spec.time_limit}",
+    ]
+    command = spec.command
+    if spec.array_size > 0:
+        throttle = f"%{spec.array_concurrency}" if spec.array_concurrency > 0 else ""
+        lines.append(f"#SBATCH --array=0-{spec.array_size - 1}{throttle}")
+        command = f"{command} --shard $SLURM_ARRAY_TASK_ID --shards {spec.array_size}"
+    lines.extend(["", "set -euo pipefail", command])
+    return "\n".join(lines)
 
 
 def write_slurm_script(spec: SlurmJobSpec, output: str | Path) -> Path:
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import re
-from dataclasses import dataclass
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
 
-import httpx
+import numpy as np
 
+from physics_ai.novelty_index import InMemoryVectorIndex, build_faiss_index, faiss
 from physics_ai.types import NoveltyNeighbor, NoveltyReport
 
 
 TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+EMBEDDING_DIM = 256
 
 
 @dataclass(frozen=True)
@@ -18,15 +27,21 @@ class LiteratureRecord:
     abstract: str
     equations: list[str]
     parameter_regime: dict[str, float]
+    _title_abstract_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
+    _equation_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Records are scored against every hypothesis; tokenize them once.
+        object.__setattr__(self, "_title_abstract_tokens", _token_set(f"{self.title} {self.abstract}"))
+        object.__setattr__(self, "_equation_tokens", _token_set(" ".join(self.equations)))
 
-def _token_set(text: str) -> set[str]:
-    return {match.group(0).lower() for match in TOKEN_RE.finditer(text)}
 
+@functools.lru_cache(maxsize=4096)
+def _token_set(text: str) -> frozenset[str]:
+    return frozenset(match.group(0).lower() for match in TOKEN_RE.finditer(text))
 
-def jaccard_similarity(a: str, b: str) -> float:
-    aset = _token_set(a)
-    bset = _token_set(b)
+
+def _jaccard_sets(aset: frozenset[str], bset: frozenset[str]) -> float:
     if not aset and not bset:
         return 1.0
     union = aset | bset
@@ -35,6 +50,10 @@ def jaccard_similarity(a: str, b: str) -> float:
     return len(aset & bset) / len(union)
 
 
+def jaccard_similarity(a: str, b: str) -> float:
+    return _jaccard_sets(_token_set(a), _token_set(b))
+
+
 def parameter_overlap_score(a: dict[str, float], b: dict[str, float]) -> float:
     keys = set(a) & set(b)
     if not keys:
@@ -48,26 +67,57 @@ def parameter_overlap_score(a: dict[str, float], b: dict[str, float]) -> float:
 
 
 def fetch_arxiv_records(query: str = "black hole modified gravity", max_results: int = 10) -> list[LiteratureRecord]:
-    url = "http://export.arxiv.org/api/query"
-    params = {
-        "search_query": f"all:{query}",
-        "start": 0,
-        "max_results": max_results,
-    }
+    coro = fetch_arxiv_records_async([query], pages=1, page_size=max_results)
     try:
-        response = httpx.get(url, params=params, timeout=10.0)
-        response.raise_for_status()
-        text = response.text
-    except Exception:
-        return default_seed_records()
-
-    # Lightweight parsing (entry chunks) to stay dependency-light.
-    entries = text.split("<entry>")
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop (e.g. a notebook): run on a worker thread's own loop.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def fetch_arxiv_records_async(
+    queries: list[str],
+    pages: int = 1,
+    page_size: int = 100,
+) -> list[LiteratureRecord]:
+    requests = [
+        {"search_query": f"all:{query}", "start": page * page_size, "max_results": page_size}
+        for query in queries
+        for page in range(pages)
+    ]
+    import httpx
+
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        responses = await asyncio.gather(
+            *[client.get(ARXIV_API_URL, params=params) for params in requests],
+            return_exceptions=True,
+        )
+    texts = [
+        response.text
+        for response in responses
+        if isinstance(response, httpx.Response) and response.is_success
+    ]
+    parsed = await asyncio.gather(*[asyncio.to_thread(_parse_atom, text) for text in texts])
+
+    records: dict[str, LiteratureRecord] = {}
+    for page_records in parsed:
+        for record in page_records:
+            records.setdefault(record.identifier, record)
+    return list(records.values()) or default_seed_records()
+
+
+def _parse_atom(text: str) -> list[LiteratureRecord]:
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        return []
     records: list[LiteratureRecord] = []
-    for chunk in entries[1:]:
-        raw_id = _extract_tag(chunk, "id")
-        title = _extract_tag(chunk, "title").strip().replace("\n", " ")
-        summary = _extract_tag(chunk, "summary").strip().replace("\n", " ")
+    for entry in root.iterfind(f"{ATOM_NS}entry"):
+        raw_id = (entry.findtext(f"{ATOM_NS}id") or "").strip()
+        title = (entry.findtext(f"{ATOM_NS}title") or "").strip().replace("\n", " ")
+        summary = (entry.findtext(f"{ATOM_NS}summary") or "").strip().replace("\n", " ")
         if not raw_id or not title:
             continue
         records.append(
@@ -79,16 +129,7 @@ def fetch_arxiv_records(query: str = "black hole modified gravity", max_results:
                 parameter_regime={},
             )
         )
-    return records or default_seed_records()
-
-
-def _extract_tag(xml_chunk: str, tag: str) -> str:
-    start = xml_chunk.find(f"<{tag}>")
-    end = xml_chunk.find(f"</{tag}>")
-    if start == -1 or end == -1:
-        return ""
-    start += len(tag) + 2
-    return xml_chunk[start:end]
+    return records
 
 
 def default_seed_records() -> list[LiteratureRecord]:
@@ -110,19 +151,59 @@ def default_seed_records() -> list[LiteratureRecord]:
     ]
 
 
+def _token_id(token: str) -> int:
+    # builtin hash() is salted per process; embeddings must agree across workers.
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def _embed(*token_sets: frozenset[str]) -> np.ndarray:
+    # Hashed bag of tokens: cheap, deterministic, and good enough to shortlist neighbors.
+    ids = np.fromiter((_token_id(token) for tokens in token_sets for token in tokens), dtype=np.uint64)
+    return np.bincount((ids % EMBEDDING_DIM).astype(np.intp), minlength=EMBEDDING_DIM).astype(np.float32)
+
+
+class CorpusIndex:
+    """Nearest-neighbor shortlist over a literature corpus, built once per campaign."""
+
+    def __init__(self, records: list[LiteratureRecord]) -> None:
+        self.records = records
+        vectors = [_embed(record._title_abstract_tokens, record._equation_tokens) for record in records]
+        self._faiss = build_faiss_index(np.stack(vectors)) if faiss is not None and vectors else None
+        self._memory = InMemoryVectorIndex()
+        if self._faiss is None:
+            for position, vector in enumerate(vectors):
+                self._memory.add(vector, {"position": position})
+
+    def candidates(self, hypothesis_text: str, equations: list[str], k: int = 10) -> list[LiteratureRecord]:
+        if len(self.records) <= k:
+            return self.records
+        query = _embed(_token_set(hypothesis_text), _token_set(" ".join(equations)))
+        if self._faiss is not None:
+            norm = np.linalg.norm(query) or 1.0
+            _, positions = self._faiss.search((query / norm)[None, :], k)
+            return [self.records[int(position)] for position in positions[0] if position >= 0]
+        return [self.records[hit["position"]] for hit in self._memory.search(query, top_k=k)]
+
+
 def score_novelty(
     run_id: str,
     hypothesis_text: str,
     equations: list[str],
     parameters: dict[str, float],
     corpus: list[LiteratureRecord] | None = None,
+    index: CorpusIndex | None = None,
+    candidates: int = 10,
 ) -> NoveltyReport:
+    if index is not None:
+        # Shortlist by embedding, then rerank only the shortlist with the composite score.
+        corpus = index.candidates(hypothesis_text, equations, k=candidates)
     corpus = corpus or default_seed_records()
     neighbors: list[NoveltyNeighbor] = []
-    hypothesis_eq_blob = " ".join(equations)
+    hypothesis_tokens = _token_set(hypothesis_text)
+    hypothesis_eq_tokens = _token_set(" ".join(equations))
     for record in corpus:
-        concept = jaccard_similarity(hypothesis_text, f"{record.title} {record.abstract}")
-        equation = jaccard_similarity(hypothesis_eq_blob, " ".join(record.equations))
+        concept = _jaccard_sets(hypothesis_tokens, record._title_abstract_tokens)
+        equation = _jaccard_sets(hypothesis_eq_tokens, record._equation_tokens)
         overlap = parameter_overlap_score(parameters, record.parameter_regime)
         composite = 0.5 * concept + 0.3 * equation + 0.2 * overlap
         neighbors.append(
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import json
+import threading
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import IO, Any, Literal, Self
 
 import numpy as np
 
 try:
     import faiss  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
+except ImportError:  # pragma: no cover - optional dependency
     faiss = None
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+def _lock_exclusive(handle: IO[str]) -> None:
+    # Without flock (e.g. Windows) single-process ownership is not enforced.
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock(handle: IO[str]) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_UN)
+
 
 def _normalize(v: np.ndarray) -> np.ndarray:
     n = np.linalg.norm(v)
@@ -22,18 +41,128 @@ def _normalize(v: np.ndarray) -> np.ndarray:
 class InMemoryVectorIndex:
     vectors: list[np.ndarray] = field(default_factory=list)
     metadata: list[dict[str, Any]] = field(default_factory=list)
+    _matrix: np.ndarray | None = field(default=None, init=False, repr=False)
+    _dirty: bool = field(default=True, init=False, repr=False)
 
     def add(self, vector: np.ndarray, meta: dict[str, Any]) -> None:
         self.vectors.append(_normalize(vector.astype(np.float32)))
         self.metadata.append(meta)
+        self._dirty = True
+
+    def _stacked(self) -> np.ndarray:
+        # Rebuilt lazily so a run of add() calls costs a single np.stack.
+        if self._dirty or self._matrix is None:
+            self._matrix = np.stack(self.vectors).astype(np.float32, copy=False)
+            self._dirty = False
+        return self._matrix
 
     def search(self, vector: np.ndarray, top_k: int = 5) -> list[dict[str, Any]]:
-        if not self.vectors:
+        if not self.vectors or top_k <= 0:
             return []
         q = _normalize(vector.astype(np.float32))
-        scores = [float(np.dot(q, v)) for v in self.vectors]
-        order = np.argsort(scores)[::-1][:top_k]
-        return [{**self.metadata[i], "score": float(scores[i])} for i in order]
+        return _top_k(self._stacked() @ q, self.metadata, top_k)
+
+
+class MMapVectorIndex:
+    """Disk-backed index: vectors in ``<path>.vec``, metadata in ``<path>.meta.jsonl``.
+
+    On POSIX an exclusive ``flock`` on the metadata file is held until :meth:`close`, so
+    only one index instance (in any process) can own the files at a time.
+    """
+
+    def __init__(self, path: str | Path, dim: int, capacity: int = 1024) -> None:
+        self.dim = dim
+        self._vec_path = Path(f"{path}.vec")
+        self._meta_path = Path(f"{path}.meta.jsonl")
+        self._lock = threading.Lock()
+        self._meta_path.parent.mkdir(parents=True, exist_ok=True)
+        self._meta_handle = self._meta_path.open("a+", encoding="utf-8")
+        try:
+            _lock_exclusive(self._meta_handle)
+        except BlockingIOError:
+            self._meta_handle.close()
+            raise RuntimeError(f"Vector index {path} is already open elsewhere.") from None
+        try:
+            self._meta_handle.seek(0)
+            self.metadata: list[dict[str, Any]] = [
+                json.loads(line) for line in self._meta_handle if line.strip()
+            ]
+            self._mm = self._open_vectors(dim, capacity)
+        except BaseException:
+            _unlock(self._meta_handle)
+            self._meta_handle.close()
+            raise
+
+    def _open_vectors(self, dim: int, capacity: int) -> np.memmap:
+        size = self._vec_path.stat().st_size if self._vec_path.exists() else 0
+        row_bytes = 4 * dim
+        if size % row_bytes:
+            raise ValueError(
+                f"{self._vec_path} is {size} bytes, not a whole number of {dim}-dim float32 rows."
+            )
+        if size // row_bytes < len(self.metadata):
+            raise ValueError(
+                f"{self._vec_path} holds {size // row_bytes} vectors but "
+                f"{self._meta_path} lists {len(self.metadata)}."
+            )
+        if size:
+            mode: Literal["r+", "w+"] = "r+"
+            capacity = size // row_bytes
+        else:
+            mode = "w+"
+            capacity = max(capacity, 1)
+        return np.memmap(str(self._vec_path), dtype=np.float32, mode=mode, shape=(capacity, dim))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._meta_handle.closed:
+                return
+            self._mm.flush()
+            _unlock(self._meta_handle)
+            self._meta_handle.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.metadata)
+
+    def _grow(self, capacity: int) -> None:
+        self._mm.flush()
+        del self._mm
+        with self._vec_path.open("r+b") as handle:
+            handle.truncate(capacity * self.dim * 4)
+        self._mm = np.memmap(str(self._vec_path), dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def add(self, vector: np.ndarray, meta: dict[str, Any]) -> None:
+        with self._lock:
+            n = len(self.metadata)
+            if n >= self._mm.shape[0]:
+                self._grow(2 * self._mm.shape[0])
+            self._mm[n] = _normalize(vector.astype(np.float32))
+            self._mm.flush()
+            # The metadata line is the commit marker: a vector without one is ignored on reopen.
+            self._meta_handle.write(json.dumps(meta) + "\n")
+            self._meta_handle.flush()
+            self.metadata.append(meta)
+
+    def search(self, vector: np.ndarray, top_k: int = 5) -> list[dict[str, Any]]:
+        with self._lock:
+            n = len(self.metadata)
+            if not n or top_k <= 0:
+                return []
+            q = _normalize(vector.astype(np.float32))
+            return _top_k(self._mm[:n] @ q, self.metadata, top_k)
+
+
+def _top_k(scores: np.ndarray, metadata: list[dict[str, Any]], top_k: int) -> list[dict[str, Any]]:
+    k = min(top_k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    order = top[np.argsort(-scores[top])]
+    return [{**metadata[i], "score": float(scores[i])} for i in order]
 
 
 def build_faiss_index(vectors: np.ndarray):
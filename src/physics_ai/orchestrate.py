@@ -1,44 +1,54 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from sqlalchemy.engine import Connection
 
 from physics_ai.artifacts import write_dataframe
 from physics_ai.background import reduce_to_background_odes
+from physics_ai.config import get_settings
 from physics_ai.explore import summarize_scan
-from physics_ai.novelty import fetch_arxiv_records, score_novelty
+from physics_ai.novelty import CorpusIndex, fetch_arxiv_records, score_novelty
 from physics_ai.paper import build_paper
 from physics_ai.perturbation import derive_master_equation
 from physics_ai.physics_rules import evaluate_constraints
 from physics_ai.proposal import ProposalGenerator
-from physics_ai.qnm import compare_methods, solve_qnm, spectrum_table
+from physics_ai.qnm import SPECTRUM_COLUMNS, compare_methods, iter_spectrum_rows, solve_qnm_methods
 from physics_ai.storage import (
+    EventLogger,
+    TransactionBuffer,
     constraint_reports_table,
+    derivation_cache_table,
     derivations_table,
     events_table,
+    flush_artifacts,
     init_db,
+    load_cached_derivations,
     novelty_reports_table,
     paper_builds_table,
     qnm_runs_table,
-    save_record,
     theories_table,
+    write_archived_artifact,
     write_artifact,
-    write_json_artifact,
 )
-from physics_ai.symbolic import derive_field_equations
+from physics_ai.symbolic import derivation_input_hash, derive_field_equations, rehydrate_derivation
 from physics_ai.types import (
     CampaignSpec,
     EventRecord,
     Method,
     PaperBuildSpec,
+    ProposalSpec,
+    QNMBatch,
     QNMRunConfig,
     TheorySpec,
 )
-from physics_ai.utils import generate_run_id
+from physics_ai.utils import generate_run_id, json_bytes, worker_context
 
 
 @dataclass(frozen=True)
@@ -60,19 +70,57 @@ class CampaignDaemonResult:
     stopped_reason: str
 
 
-def _log_event(engine, run_id: str, stage: str, status: str, message: str, payload: dict[str, Any] | None = None) -> None:
+QNM_METHODS = (Method.SHOOTING, Method.WKB, Method.SPECTRAL)
+
+AGGREGATE_SPECTRUM_COLUMNS = [
+    *SPECTRUM_COLUMNS,
+    "theory_name",
+    "method_disagreement_real",
+    "method_disagreement_imag",
+]
+
+
+@dataclass(frozen=True)
+class ProposalOutcome:
+    name: str
+    accepted: bool
+    records: list[tuple[str, dict[str, Any]]]
+    spectrum_rows: list[tuple[Any, ...]] = field(default_factory=list)
+    artifacts: list[tuple[str, str, str | bytes]] = field(default_factory=list)
+    hypothesis_text: str = ""
+    equations: list[str] = field(default_factory=list)
+    parameters: dict[str, float] = field(default_factory=dict)
+    derivation_summary: dict[str, Any] = field(default_factory=dict)
+    qnm_summary: dict[str, Any] = field(default_factory=dict)
+    paper_outputs: list[str] = field(default_factory=list)
+
+
+def _event_row(
+    run_id: str,
+    stage: str,
+    status: str,
+    message: str,
+    payload: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     event = EventRecord(run_id=run_id, stage=stage, status=status, message=message)
-    save_record(
-        engine,
-        events_table,
-        {
-            "run_id": event.run_id,
-            "stage": event.stage,
-            "status": event.status,
-            "message": event.message,
-            "payload": payload or event.model_dump(mode="json"),
-        },
-    )
+    return {
+        "run_id": event.run_id,
+        "stage": event.stage,
+        "status": event.status,
+        "message": event.message,
+        "payload": payload or event.to_dict(),
+    }
+
+
+def _log_event(
+    logger: EventLogger,
+    run_id: str,
+    stage: str,
+    status: str,
+    message: str,
+    payload: dict[str, Any] | None = None,
+) -> None:
+    logger.log(_event_row(run_id, stage, status, message, payload))
 
 
 def _proposal_to_theory(seed: TheorySpec, name: str, action: str, parameters: dict[str, float]) -> TheorySpec:
@@ -83,177 +131,233 @@ def _proposal_to_theory(seed: TheorySpec, name: str, action: str, parameters: di
     return theory
 
 
-def run_autonomous_campaign(campaign: CampaignSpec) -> CampaignResult:
-    engine = init_db()
-    generator = ProposalGenerator(enable_llm=campaign.enable_llm)
-    _log_event(engine, campaign.run_id, "propose", "started", f"Campaign {campaign.name} started.")
+def _proposal_input_hash(seed: TheorySpec, proposal: ProposalSpec) -> str:
+    return derivation_input_hash(proposal.action, {**seed.parameters, **proposal.parameters})
 
-    proposals = generator.generate(campaign.seed_theory, campaign.proposal_count)
-    accepted = 0
-    rejected = 0
-    paper_outputs: list[str] = []
-    corpus = fetch_arxiv_records()
-    aggregate_scan_rows: list[pd.DataFrame] = []
-
-    for proposal in proposals:
-        theory = _proposal_to_theory(
-            campaign.seed_theory,
-            name=proposal.name,
-            action=proposal.action,
-            parameters=proposal.parameters,
-        )
-        save_record(
-            engine,
-            theories_table,
+
+def _process_proposal(
+    seed: TheorySpec,
+    proposal: ProposalSpec,
+    run_id: str,
+    cached_derivation: dict[str, Any] | None = None,
+) -> ProposalOutcome:
+    theory = _proposal_to_theory(
+        seed,
+        name=proposal.name,
+        action=proposal.action,
+        parameters=proposal.parameters,
+    )
+    theory_payload = theory.model_dump(mode="json")
+    records: list[tuple[str, dict[str, Any]]] = [
+        (
+            theories_table.name,
             {
-                "run_id": campaign.run_id,
+                "run_id": run_id,
                 "name": theory.name,
-                "payload": theory.model_dump(mode="json"),
+                "payload": theory_payload,
             },
+        ),
+        (events_table.name, _event_row(run_id, "validate", "ok", f"Accepted proposal payload: {proposal.name}")),
+    ]
+
+    if cached_derivation is not None:
+        derivation = rehydrate_derivation(theory, run_id, cached_derivation, theory_payload=theory_payload)
+        event = _event_row(run_id, "derive", "cache_hit", f"Reused derivation: {theory.name}")
+        records.append((events_table.name, event))
+    else:
+        derivation = derive_field_equations(theory, run_id=run_id, theory_payload=theory_payload)
+        records.append(
+            (
+                derivation_cache_table.name,
+                {
+                    "input_hash": _proposal_input_hash(seed, proposal),
+                    "payload": {
+                        "family": derivation.metadata["family"],
+                        "action_srepr": derivation.metadata["action_srepr"],
+                        "equations": derivation.equations,
+                    },
+                },
+            )
         )
-        _log_event(engine, campaign.run_id, "validate", "ok", f"Accepted proposal payload: {proposal.name}")
-
-        derivation = derive_field_equations(theory, run_id=campaign.run_id)
-        save_record(
-            engine,
-            derivations_table,
+    derivation_payload = derivation.to_dict()
+    records.append(
+        (
+            derivations_table.name,
             {
-                "run_id": campaign.run_id,
+                "run_id": run_id,
                 "stage": "eom",
                 "canonical_hash": derivation.canonical_hash,
-                "payload": derivation.model_dump(mode="json"),
+                "payload": derivation_payload,
             },
         )
-        write_json_artifact(
-            campaign.run_id,
-            "derive",
-            f"{theory.name}_eom.json",
-            derivation.model_dump(mode="json"),
+    )
+    # Artifacts go back to the driver, which owns the run's archive.
+    artifacts: list[tuple[str, str, str | bytes]] = [
+        ("derive", f"{theory.name}_eom.json", json_bytes(derivation_payload, sort_keys=True))
+    ]
+
+    background = reduce_to_background_odes(theory, derivation, run_id=run_id)
+    if not background.consistency.get("square_system", False):
+        records.append(
+            (events_table.name, _event_row(run_id, "background", "rejected", f"Inconsistent system: {theory.name}"))
         )
+        return ProposalOutcome(name=theory.name, accepted=False, records=records, artifacts=artifacts)
+
+    perturb = derive_master_equation(background, run_id=run_id)
+    artifacts.append(("perturb", f"{theory.name}_master.txt", perturb.master_equation))
 
-        background = reduce_to_background_odes(theory, derivation, run_id=campaign.run_id)
-        if not background.consistency.get("square_system", False):
-            rejected += 1
-            _log_event(engine, campaign.run_id, "background", "rejected", f"Inconsistent system: {theory.name}")
-            continue
-
-        perturb = derive_master_equation(background, run_id=campaign.run_id)
-        write_artifact(campaign.run_id, "perturb", f"{theory.name}_master.txt", perturb.master_equation)
-
-        qnm_results = []
-        for method in [Method.SHOOTING, Method.WKB, Method.SPECTRAL]:
-            config = QNMRunConfig(method=method, l=2, n=0, mass=theory.parameters.get("mass", 1.0))
-            qnm = solve_qnm(config=config, run_id=campaign.run_id, method=method)
-            qnm_results.append(qnm)
-            save_record(
-                engine,
-                qnm_runs_table,
+    config = QNMRunConfig(method=QNM_METHODS[0], l=2, n=0, mass=theory.parameters.get("mass", 1.0))
+    qnm_results = solve_qnm_methods(config, run_id, QNM_METHODS)
+    for qnm in qnm_results:
+        records.append(
+            (
+                qnm_runs_table.name,
                 {
-                    "run_id": campaign.run_id,
+                    "run_id": run_id,
                     "method": qnm.method.value,
                     "omega_real": qnm.omega_real,
                     "omega_imag": qnm.omega_imag,
-                    "payload": qnm.model_dump(mode="json"),
+                    "payload": qnm.to_dict(),
                 },
             )
+        )
 
-        disagreement = compare_methods(qnm_results)
-        constraints = evaluate_constraints(campaign.run_id, theory, qnm_results=qnm_results)
-        save_record(
-            engine,
-            constraint_reports_table,
+    qnm_batch = QNMBatch.from_results(qnm_results)
+    disagreement = compare_methods(qnm_batch)
+    constraints = evaluate_constraints(run_id, theory, qnm_results=qnm_batch)
+    records.append(
+        (
+            constraint_reports_table.name,
             {
-                "run_id": campaign.run_id,
+                "run_id": run_id,
                 "is_valid": constraints.is_valid,
-                "payload": constraints.model_dump(mode="json"),
+                "payload": constraints.to_dict(),
             },
         )
-        if not constraints.is_valid:
-            rejected += 1
-            _log_event(
-                engine,
-                campaign.run_id,
-                "constraints",
-                "rejected",
-                f"{theory.name} rejected by physics filters: {constraints.reasons}",
+    )
+    if not constraints.is_valid:
+        records.append(
+            (
+                events_table.name,
+                _event_row(
+                    run_id,
+                    "constraints",
+                    "rejected",
+                    f"{theory.name} rejected by physics filters: {constraints.reasons}",
+                ),
             )
-            continue
-
-        table = spectrum_table(qnm_results)
-        table["theory_name"] = theory.name
-        table["method_disagreement_real"] = disagreement.max_abs_delta_real
-        table["method_disagreement_imag"] = disagreement.max_abs_delta_imag
-        aggregate_scan_rows.append(table)
-
-        novelty = score_novelty(
-            run_id=campaign.run_id,
-            hypothesis_text=f"{theory.name}: {proposal.rationale}",
-            equations=derivation.equations + [perturb.master_equation, perturb.effective_potential],
-            parameters=theory.parameters,
-            corpus=corpus,
         )
-        save_record(
-            engine,
-            novelty_reports_table,
+        return ProposalOutcome(name=theory.name, accepted=False, records=records, artifacts=artifacts)
+
+    row_tail = (theory.name, disagreement.max_abs_delta_real, disagreement.max_abs_delta_imag)
+    spectrum_rows = [row + row_tail for row in iter_spectrum_rows(qnm_results)]
+
+    return ProposalOutcome(
+        name=theory.name,
+        accepted=True,
+        records=records,
+        spectrum_rows=spectrum_rows,
+        artifacts=artifacts,
+        hypothesis_text=f"{theory.name}: {proposal.rationale}",
+        equations=derivation.equations + [perturb.master_equation, perturb.effective_potential],
+        parameters=theory.parameters,
+        derivation_summary={"family": derivation.metadata.get("family"), "equations": derivation.equations},
+        qnm_summary={
+            "method_consistent": disagreement.is_consistent,
+            "max_abs_delta_real": disagreement.max_abs_delta_real,
+            "max_abs_delta_imag": disagreement.max_abs_delta_imag,
+        },
+    )
+
+
+def _fetch_corpus_index() -> CorpusIndex:
+    return CorpusIndex(fetch_arxiv_records())
+
+
+def _publish_proposal(outcome: ProposalOutcome, run_id: str, corpus_index: CorpusIndex) -> ProposalOutcome:
+    novelty = score_novelty(
+        run_id=run_id,
+        hypothesis_text=outcome.hypothesis_text,
+        equations=outcome.equations,
+        parameters=outcome.parameters,
+        index=corpus_index,
+    )
+    out_dir = Path("artifacts") / run_id / "paper" / outcome.name
+    paper_spec = PaperBuildSpec(
+        run_id=run_id,
+        title=f"{outcome.name}: Autonomous Modified-Gravity Analysis",
+        authors=["Autonomous Physics AI"],
+        output_dir=str(out_dir),
+        include_latex=True,
+        include_markdown=True,
+    )
+    outputs = build_paper(
+        paper_spec,
+        derivation=outcome.derivation_summary,
+        qnm_summary=outcome.qnm_summary,
+        novelty=novelty,
+    )
+    records: list[tuple[str, dict[str, Any]]] = [
+        (
+            novelty_reports_table.name,
             {
-                "run_id": campaign.run_id,
+                "run_id": run_id,
                 "novelty_score": novelty.novelty_score,
                 "payload": novelty.model_dump(mode="json"),
             },
-        )
-
-        out_dir = Path("artifacts") / campaign.run_id / "paper" / theory.name
-        paper_spec = PaperBuildSpec(
-            run_id=campaign.run_id,
-            title=f"{theory.name}: Autonomous Modified-Gravity Analysis",
-            authors=["Autonomous Physics AI"],
-            output_dir=str(out_dir),
-            include_latex=True,
-            include_markdown=True,
-        )
-        outputs = build_paper(
-            paper_spec,
-            derivation={"family": derivation.metadata.get("family"), "equations": derivation.equations},
-            qnm_summary={
-                "method_consistent": disagreement.is_consistent,
-                "max_abs_delta_real": disagreement.max_abs_delta_real,
-                "max_abs_delta_imag": disagreement.max_abs_delta_imag,
-            },
-            novelty=novelty,
-        )
-        paper_outputs.extend(str(path) for path in outputs.values())
-        save_record(
-            engine,
-            paper_builds_table,
+        ),
+        (
+            paper_builds_table.name,
             {
-                "run_id": campaign.run_id,
+                "run_id": run_id,
                 "payload": {
-                    "theory_name": theory.name,
+                    "theory_name": outcome.name,
                     "outputs": {key: str(path) for key, path in outputs.items()},
                 },
             },
-        )
-        accepted += 1
-        _log_event(engine, campaign.run_id, "paper", "ok", f"Built paper outputs for {theory.name}")
+        ),
+        (events_table.name, _event_row(run_id, "paper", "ok", f"Built paper outputs for {outcome.name}")),
+    ]
+    return replace(
+        outcome,
+        records=outcome.records + records,
+        paper_outputs=[str(path) for path in outputs.values()],
+    )
+
 
-    if aggregate_scan_rows:
-        merged = pd.concat(aggregate_scan_rows, ignore_index=True)
-        merged_path = write_dataframe(
-            merged, Path("artifacts") / campaign.run_id / "scan" / "qnm_spectrum.parquet"
+def run_autonomous_campaign(campaign: CampaignSpec, workers: int | None = None) -> CampaignResult:
+    engine = init_db()
+    generator = ProposalGenerator(enable_llm=campaign.enable_llm)
+    with EventLogger(engine) as logger:
+        _log_event(logger, campaign.run_id, "propose", "started", f"Campaign {campaign.name} started.")
+        # One connection serves the whole proposal loop; each proposal still commits on its own.
+        with engine.connect() as conn:
+            outcomes = _run_proposals(campaign, generator, conn, logger, workers)
+
+        finished = [outcome for outcome in outcomes if outcome is not None]
+        accepted = sum(outcome.accepted for outcome in finished)
+        rejected = len(finished) - accepted
+        paper_outputs = [path for outcome in finished for path in outcome.paper_outputs]
+        aggregate_scan_rows = [row for outcome in finished for row in outcome.spectrum_rows]
+
+        if aggregate_scan_rows:
+            merged = pd.DataFrame.from_records(aggregate_scan_rows, columns=AGGREGATE_SPECTRUM_COLUMNS)
+            merged_path = write_dataframe(
+                merged, Path("artifacts") / campaign.run_id / "scan" / "qnm_spectrum.parquet"
+            )
+            summary = summarize_scan(merged)
+            summary["spectrum_file"] = str(merged_path)
+        else:
+            summary = {"rows": 0, "valid_rows": 0}
+
+        _log_event(
+            logger,
+            campaign.run_id,
+            "finalize",
+            "ok",
+            f"Campaign finished accepted={accepted} rejected={rejected}",
+            payload=summary,
         )
-        summary = summarize_scan(merged)
-        summary["spectrum_file"] = str(merged_path)
-    else:
-        summary = {"rows": 0, "valid_rows": 0}
-
-    _log_event(
-        engine,
-        campaign.run_id,
-        "finalize",
-        "ok",
-        f"Campaign finished accepted={accepted} rejected={rejected}",
-        payload=summary,
-    )
     return CampaignResult(
         run_id=campaign.run_id,
         accepted_theories=accepted,
@@ -263,6 +367,60 @@ def run_autonomous_campaign(campaign: CampaignSpec) -> CampaignResult:
     )
 
 
+def _run_proposals(
+    campaign: CampaignSpec,
+    generator: ProposalGenerator,
+    conn: Connection,
+    logger: EventLogger,
+    workers: int | None,
+) -> list[ProposalOutcome | None]:
+    proposals = generator.generate(campaign.seed_theory, campaign.proposal_count)
+    outcomes: list[ProposalOutcome | None] = [None] * len(proposals)
+    fetcher = ThreadPoolExecutor(max_workers=1)
+    write = write_archived_artifact if get_settings().artifact_archive else write_artifact
+
+    def record(index: int, outcome: ProposalOutcome) -> None:
+        # Novelty and paper builds need the corpus, so they run here once the fetch has landed.
+        if outcome.accepted:
+            outcome = _publish_proposal(outcome, campaign.run_id, corpus_index_future.result())
+        outcomes[index] = outcome
+        for stage, filename, content in outcome.artifacts:
+            write(campaign.run_id, stage, filename, content)
+        with TransactionBuffer(conn) as buffer:
+            for table_name, row in outcome.records:
+                if table_name == events_table.name:
+                    logger.log(row)
+                else:
+                    buffer.append(events_table.metadata.tables[table_name], row)
+
+    input_hashes = [_proposal_input_hash(campaign.seed_theory, proposal) for proposal in proposals]
+    cache = load_cached_derivations(conn, input_hashes)
+    jobs = [
+        (campaign.seed_theory, proposal, campaign.run_id, cache.get(input_hash))
+        for proposal, input_hash in zip(proposals, input_hashes)
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, max(len(proposals), 1))
+    try:
+        if workers == 1:
+            corpus_index_future = fetcher.submit(_fetch_corpus_index)
+            for index, job in enumerate(jobs):
+                record(index, _process_proposal(*job))
+        else:
+            # The event logger's writer thread is already running, so workers must not be
+            # forked from this process (they could inherit its held locks).
+            with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+                futures = {executor.submit(_process_proposal, *job): index for index, job in enumerate(jobs)}
+                corpus_index_future = fetcher.submit(_fetch_corpus_index)
+                # Results are persisted as they land; aggregates below keep proposal order.
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+    finally:
+        fetcher.shutdown(wait=False, cancel_futures=True)
+        flush_artifacts(campaign.run_id)
+    return outcomes
+
+
 def run_autonomous_daemon(
     campaign: CampaignSpec,
     *,
@@ -270,6 +428,7 @@ def run_autonomous_daemon(
     sleep_seconds: int = 120,
     max_cycles: int | None = None,
     proposal_count: int | None = None,
+    workers: int | None = None,
 ) -> CampaignDaemonResult:
     if hours <= 0 and (max_cycles is None or max_cycles <= 0):
         raise ValueError("Provide a positive hours budget or positive max_cycles.")
@@ -296,7 +455,7 @@ def run_autonomous_daemon(
         if proposal_count is not None:
             cycle_campaign.proposal_count = proposal_count
 
-        cycle_result = run_autonomous_campaign(cycle_campaign)
+        cycle_result = run_autonomous_campaign(cycle_campaign, workers=workers)
         cycles_completed += 1
         cycle_run_ids.append(cycle_result.run_id)
         total_accepted += cycle_result.accepted_theories
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from string import Template
 from typing import Any
@@ -7,6 +8,7 @@ from typing import Any
 from physics_ai.types import NoveltyReport, PaperBuildSpec
 
 
+@functools.lru_cache(maxsize=8)
 def _load_template(name: str) -> Template:
     base = Path(__file__).parent / "templates" / name
     return Template(base.read_text(encoding="utf-8"))
@@ -57,7 +59,7 @@ def build_paper(
         tex_path = out_dir / "paper.tex"
         tex_path.write_text(tex_tpl.substitute(context), encoding="utf-8")
         bib_path = out_dir / "refs.bib"
-        bib_path.write_text(DEFAULT_BIB, encoding="utf-8")
+        bib_path.write_bytes(DEFAULT_BIB_BYTES)
         written["latex"] = tex_path
         written["bib"] = bib_path
 
@@ -77,3 +79,4 @@ DEFAULT_BIB = """@article{regge_wheeler_1957,
   year = {1957}
 }
 """
+DEFAULT_BIB_BYTES = DEFAULT_BIB.encode("utf-8")
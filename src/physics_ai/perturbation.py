@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import functools
+
 import sympy as sp
 
 from physics_ai.types import BackgroundSystem, PerturbationSystem
 
 
+# typed=True: mass=1 and mass=1.0 print differently and must not share an entry.
+@functools.lru_cache(maxsize=128, typed=True)
 def regge_wheeler_potential(mass: float, ell: int) -> sp.Expr:
     r = sp.Symbol("r", positive=True)
     M = sp.Symbol("M", positive=True)
     l = sp.Symbol("l", integer=True, nonnegative=True)
     potential = (1 - (2 * M / r)) * ((l * (l + 1) / r**2) - (6 * M / r**3))
-    return sp.simplify(potential.subs({M: mass, l: ell}))
+    # Already a compact rational function of r; simplify() only reshuffles it at high cost.
+    return potential.subs({M: mass, l: ell})
 
 
 def derive_master_equation(
@@ -20,6 +25,19 @@ def derive_master_equation(
     mass: float = 1.0,
     ell: int = 2,
 ) -> PerturbationSystem:
+    master, potential = _master_strings(mass, ell)
+    return PerturbationSystem(
+        run_id=run_id,
+        theory_name=background.theory_name,
+        family=family,
+        master_equation=master,
+        effective_potential=potential,
+        metadata={"ell": ell, "mass": mass},
+    )
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _master_strings(mass: float, ell: int) -> tuple[str, str]:
     r = sp.Symbol("r", positive=True)
     omega = sp.Symbol("omega")
     psi = sp.Function("Psi")
@@ -27,14 +45,7 @@ def derive_master_equation(
 
     # Compact r-based representation of the master equation.
     master = sp.Eq(sp.diff(psi(r), r, 2) + (omega**2 - V) * psi(r), 0)
-    return PerturbationSystem(
-        run_id=run_id,
-        theory_name=background.theory_name,
-        family=family,
-        master_equation=str(master),
-        effective_potential=str(V),
-        metadata={"ell": ell, "mass": mass},
-    )
+    return str(master), str(V)
 
 
 def verify_regge_wheeler(perturbation: PerturbationSystem) -> bool:
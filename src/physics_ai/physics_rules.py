@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from physics_ai.types import ConstraintReport, QNMResult, TheorySpec
+import numpy as np
+
+from physics_ai.types import ConstraintReport, QNMBatch, QNMResult, TheorySpec
 
 
 def _get_parameter(theory: TheorySpec, *names: str, default: float = 1.0) -> float:
@@ -15,7 +17,7 @@ def _get_parameter(theory: TheorySpec, *names: str, default: float = 1.0) -> flo
 def evaluate_constraints(
     run_id: str,
     theory: TheorySpec,
-    qnm_results: Iterable[QNMResult] | None = None,
+    qnm_results: QNMBatch | Iterable[QNMResult] | None = None,
 ) -> ConstraintReport:
     reasons: list[str] = []
     metrics: dict[str, float] = {}
@@ -38,10 +40,12 @@ def evaluate_constraints(
     metrics["alpha"] = alpha
     metrics["beta"] = beta
 
-    if qnm_results:
-        max_growth = max((result.omega_imag for result in qnm_results), default=-1.0)
-        metrics["max_omega_imag"] = max_growth
-        if max_growth > 0:
+    # Materialized once: callers may pass a one-shot iterator.
+    batch = QNMBatch.coerce(qnm_results) if qnm_results is not None else None
+    if batch is not None and len(batch):
+        imags = batch.omega_imag
+        metrics["max_omega_imag"] = float(imags.max())
+        if np.any(imags > 0):
             reasons.append("Unstable mode detected: positive Im(omega).")
 
     is_valid = len(reasons) == 0
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+import threading
+import warnings
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
-from sqlalchemy import JSON, Boolean, Column, Float, Integer, MetaData, String, Table, Text, create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    event,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
 
 from physics_ai.config import get_settings
-from physics_ai.utils import canonical_json
+from physics_ai.utils import json_bytes
+
+log = logging.getLogger(__name__)
 
 
 metadata = MetaData()
@@ -27,7 +52,15 @@ derivations_table = Table(
     Column("id", Integer, primary_key=True, autoincrement=True),
     Column("run_id", String(64), nullable=False, index=True),
     Column("stage", String(128), nullable=False),
-    Column("canonical_hash", String(128), nullable=False),
+    Column("canonical_hash", String(128), nullable=False, index=True),
+    Column("payload", JSON, nullable=False),
+)
+
+derivation_cache_table = Table(
+    "derivation_cache",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("input_hash", String(128), nullable=False, index=True),
     Column("payload", JSON, nullable=False),
 )
 
@@ -107,20 +140,181 @@ events_table = Table(
 
 def create_engine_from_settings() -> Engine:
     settings = get_settings()
-    return create_engine(settings.database_url, future=True)
+    engine = create_engine(settings.database_url, future=True)
+    if _is_memory_sqlite(engine):
+        # Every new connection to sqlite:// is a fresh, empty database, so all threads
+        # must share the one connection that holds the schema.
+        engine.dispose()
+        engine = create_engine(
+            settings.database_url,
+            future=True,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    return engine
+
+
+def _is_memory_sqlite(engine: Engine) -> bool:
+    return engine.dialect.name == "sqlite" and engine.url.database in (None, "", ":memory:")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 def init_db(engine: Engine | None = None) -> Engine:
     engine = engine or create_engine_from_settings()
+    if engine.dialect.name == "sqlite" and not event.contains(engine, "connect", _set_sqlite_pragmas):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     metadata.create_all(engine)
     return engine
 
 
-def save_record(engine: Engine, table: Table, payload: dict[str, Any]) -> None:
-    with engine.begin() as conn:
+@contextmanager
+def _begin(bind: Engine | Connection) -> Iterator[Connection]:
+    # A held Connection commits per block; an Engine checks a connection out per block.
+    if isinstance(bind, Connection):
+        with bind.begin():
+            yield bind
+    else:
+        with bind.begin() as conn:
+            yield conn
+
+
+def save_record(bind: Engine | Connection, table: Table, payload: dict[str, Any]) -> None:
+    with _begin(bind) as conn:
         conn.execute(table.insert().values(**payload))
 
 
+def save_records(bind: Engine | Connection, table: Table, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    with _begin(bind) as conn:
+        conn.execute(table.insert(), rows)
+
+
+def load_cached_derivations(
+    bind: Engine | Connection,
+    input_hashes: list[str],
+) -> dict[str, dict[str, Any]]:
+    if not input_hashes:
+        return {}
+    query = select(derivation_cache_table.c.input_hash, derivation_cache_table.c.payload).where(
+        derivation_cache_table.c.input_hash.in_(set(input_hashes))
+    )
+    with _begin(bind) as conn:
+        return {input_hash: payload for input_hash, payload in conn.execute(query)}
+
+
+class TransactionBuffer:
+    """Collect rows per table and write them in one transaction on flush or exit."""
+
+    def __init__(self, bind: Engine | Connection) -> None:
+        self.bind = bind
+        self._rows: dict[Table, list[dict[str, Any]]] = {}
+
+    def append(self, table: Table, row: dict[str, Any]) -> None:
+        self._rows.setdefault(table, []).append(row)
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        pending, self._rows = self._rows, {}
+        with _begin(self.bind) as conn:
+            for table, rows in pending.items():
+                conn.execute(table.insert(), rows)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+
+class EventLogger:
+    """Write event rows from a background thread in batched inserts.
+
+    In-memory SQLite has a single shared connection that cannot take a second
+    concurrent transaction, so there rows are batched and written on the caller's thread.
+    """
+
+    _STOP = object()
+
+    def __init__(self, engine: Engine, batch_size: int = 256, flush_interval: float = 0.05) -> None:
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._error: BaseException | None = None
+        self._pending: list[dict[str, Any]] = []
+        self._sync_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        if not _is_memory_sqlite(engine):
+            self._thread = threading.Thread(target=self._run, name="physai-event-logger", daemon=True)
+            self._thread.start()
+
+    def log(self, row: dict[str, Any]) -> None:
+        if self._thread is not None:
+            self._queue.put(row)
+            return
+        with self._sync_lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        rows, self._pending = self._pending, []
+        save_records(self.engine, events_table, rows)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            rows = [item]
+            try:
+                while len(rows) < self.batch_size:
+                    item = self._queue.get(timeout=self.flush_interval)
+                    if item is self._STOP:
+                        stopping = True
+                        break
+                    rows.append(item)
+            except queue.Empty:
+                pass
+            try:
+                save_records(self.engine, events_table, rows)
+            except SQLAlchemyError as exc:  # surfaced to the caller on close()
+                self._error = exc
+
+    def close(self) -> None:
+        if self._thread is None:
+            with self._sync_lock:
+                self._flush_pending()
+            return
+        self._queue.put(self._STOP)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # The body is already failing; don't let a write error replace its exception.
+        try:
+            self.close()
+        except SQLAlchemyError:
+            log.exception("Event logger failed while handling another error")
+
+
 def artifact_path(run_id: str, stage: str, filename: str) -> Path:
     settings = get_settings()
     path = settings.artifact_root / run_id / stage
@@ -128,13 +322,86 @@ def artifact_path(run_id: str, stage: str, filename: str) -> Path:
     return path / filename
 
 
-def write_artifact(run_id: str, stage: str, filename: str, content: str) -> Path:
+def write_artifact(run_id: str, stage: str, filename: str, content: str | bytes) -> Path:
     path = artifact_path(run_id, stage, filename)
-    path.write_text(content, encoding="utf-8")
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding="utf-8")
     return path
 
 
 def write_json_artifact(run_id: str, stage: str, filename: str, payload: dict[str, Any]) -> Path:
-    path = artifact_path(run_id, stage, filename)
-    path.write_text(canonical_json(payload), encoding="utf-8")
-    return path
+    return write_artifact(run_id, stage, filename, json_bytes(payload, sort_keys=True))
+
+
+# Opt-in (PHYSAI_ARTIFACT_ARCHIVE=1) alternative for campaigns that emit many small
+# files: one zip per run_id, held open for the life of the process.
+_ARTIFACT_STORES: dict[str, zipfile.ZipFile] = {}
+# Runs whose archive holds superseded duplicate members, compacted on flush.
+_ARTIFACT_OVERWRITTEN: set[str] = set()
+_ARTIFACT_LOCK = threading.Lock()
+
+
+def _artifact_store(run_id: str) -> zipfile.ZipFile:
+    store = _ARTIFACT_STORES.get(run_id)
+    if store is None:
+        archive = get_settings().artifact_root / run_id / "artifacts.zip"
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        # Mode "w": re-running a run_id replaces its archive rather than piling up
+        # duplicate members that zip cannot overwrite in place.
+        store = zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED)
+        _ARTIFACT_STORES[run_id] = store
+    return store
+
+
+def write_archived_artifact(
+    run_id: str,
+    stage: str,
+    filename: str,
+    content: str | bytes,
+) -> Path:
+    """Write ``<stage>/<filename>`` into the run's ``artifacts.zip``.
+
+    Like ``write_artifact``, writing the same name again replaces the earlier content.
+    Returns ``<archive>/<stage>/<filename>``, the member's locator in the same form
+    ``zipfile.Path`` uses; it is readable once ``flush_artifacts`` closes the archive.
+    """
+    member = f"{stage}/{filename}"
+    with _ARTIFACT_LOCK:
+        store = _artifact_store(run_id)
+        if member in store.NameToInfo:
+            # Zip members cannot be replaced in place: append the new copy (readers
+            # resolve a name to its last entry) and drop the stale one on flush.
+            _ARTIFACT_OVERWRITTEN.add(run_id)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                store.writestr(member, content)
+        else:
+            store.writestr(member, content)
+        return Path(str(store.filename)) / member
+
+
+def flush_artifacts(run_id: str | None = None) -> None:
+    with _ARTIFACT_LOCK:
+        run_ids = [run_id] if run_id is not None else list(_ARTIFACT_STORES)
+        for key in run_ids:
+            store = _ARTIFACT_STORES.pop(key, None)
+            if store is not None:
+                store.close()
+                if key in _ARTIFACT_OVERWRITTEN:
+                    _ARTIFACT_OVERWRITTEN.discard(key)
+                    _compact_archive(Path(str(store.filename)))
+
+
+def _compact_archive(archive: Path) -> None:
+    staging = archive.with_suffix(".zip.tmp")
+    with zipfile.ZipFile(archive) as source, zipfile.ZipFile(
+        staging, "w", compression=zipfile.ZIP_DEFLATED
+    ) as target:
+        for info in source.NameToInfo.values():
+            target.writestr(info, source.read(info))
+    staging.replace(archive)
+
+
+atexit.register(flush_artifacts)
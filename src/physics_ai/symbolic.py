@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any
 
@@ -7,7 +8,7 @@ import sympy as sp
 
 from physics_ai.theory import classify_theory_family
 from physics_ai.types import DerivationArtifact, TheorySpec
-from physics_ai.utils import stable_hash
+from physics_ai.utils import IncrementalHasher, stable_hash
 
 
 @dataclass(frozen=True)
@@ -26,28 +27,34 @@ def _action_locals() -> dict[str, Any]:
     return {"R": R, "Lambda": Lambda, "kappa": kappa, "f": f, "pi": sp.pi}
 
 
-def compile_action(theory: TheorySpec) -> SymbolicTheory:
+@functools.lru_cache(maxsize=256)
+def _compile_normalized(normalized: str, param_names: tuple[str, ...]) -> tuple[sp.Expr, dict[str, sp.Symbol]]:
     locals_map = _action_locals()
     # Force declared parameters to be plain symbols, even when names collide
     # with SymPy built-ins (e.g. beta).
-    for param_name in theory.parameters:
+    for param_name in param_names:
         locals_map[param_name] = sp.Symbol(param_name, real=True)
-    normalized = theory.action.replace("^", "**")
     expr = sp.sympify(normalized, locals=locals_map)
-    family = classify_theory_family(theory)
-    symbols = {name: locals_map[name] for name in theory.parameters}
+    return sp.expand(expr), {name: locals_map[name] for name in param_names}
+
+
+def compile_action(theory: TheorySpec) -> SymbolicTheory:
+    # Proposals reuse a handful of actions; only the theory name varies between them.
+    normalized = theory.action.replace("^", "**")
+    action_expr, cached_symbols = _compile_normalized(normalized, tuple(sorted(theory.parameters)))
     return SymbolicTheory(
         theory_name=theory.name,
-        family=family,
-        action_expr=sp.expand(expr),
-        symbols=symbols,
+        family=classify_theory_family(theory),
+        action_expr=action_expr,
+        symbols={name: cached_symbols[name] for name in theory.parameters},
     )
 
 
+@functools.lru_cache(maxsize=256)
 def canonicalize_expr(expr: sp.Expr) -> str:
-    # sympy canonical term ordering + serialized tree = deterministic fingerprint
-    simplified = sp.together(sp.expand(expr))
-    return sp.srepr(simplified)
+    # sympy canonical term ordering + serialized tree = deterministic fingerprint.
+    # compile_action already expands the action, so no together()/expand() round-trip here.
+    return sp.srepr(expr)
 
 
 def _einstein_equation_strings() -> list[str]:
@@ -82,30 +89,66 @@ def _fr_equation_strings() -> list[str]:
     return [str(eq), str(trace)]
 
 
-def derive_field_equations(theory: TheorySpec, run_id: str) -> DerivationArtifact:
+# The field equations for each family have no inputs; build their strings once at import.
+_EINSTEIN_EQS = tuple(_einstein_equation_strings())
+_FR_EQS = tuple(_fr_equation_strings())
+_GENERIC_EQS = (str(sp.Eq(sp.Symbol("deltaS/dphi"), 0)),)
+_FAMILY_EQS = {"GR": _EINSTEIN_EQS, "f(R)": _FR_EQS}
+
+
+# Part of every derivation cache key: bump it whenever derive_field_equations output
+# (family classification, srepr canonical form, equation strings) changes, so rows
+# written by older code are no longer reused.
+DERIVATION_CACHE_VERSION = 1
+
+
+def derivation_input_hash(action: str, parameters: dict[str, float]) -> str:
+    return stable_hash(
+        {
+            "version": DERIVATION_CACHE_VERSION,
+            "action": action.replace("^", "**"),
+            "params": sorted(parameters.items()),
+        }
+    )
+
+
+def derive_field_equations(
+    theory: TheorySpec,
+    run_id: str,
+    theory_payload: dict[str, Any] | None = None,
+) -> DerivationArtifact:
     compiled = compile_action(theory)
     family = compiled.family
-    if family == "GR":
-        equations = _einstein_equation_strings()
-    elif family == "f(R)":
-        equations = _fr_equation_strings()
-    else:
-        generic_eq = sp.Eq(sp.Symbol("deltaS/dphi"), 0)
-        equations = [str(generic_eq)]
-
-    payload = {
-        "theory": theory.model_dump(mode="json"),
+    cached = {
         "family": family,
         "action_srepr": canonicalize_expr(compiled.action_expr),
-        "equations": equations,
+        "equations": list(_FAMILY_EQS.get(family, _GENERIC_EQS)),
     }
+    return rehydrate_derivation(theory, run_id, cached, theory_payload=theory_payload)
+
+
+def rehydrate_derivation(
+    theory: TheorySpec,
+    run_id: str,
+    cached: dict[str, Any],
+    theory_payload: dict[str, Any] | None = None,
+) -> DerivationArtifact:
+    """Rebuild an artifact from the theory-independent parts of an earlier derivation."""
+    hasher = IncrementalHasher()
+    hasher.update(theory_payload if theory_payload is not None else theory.model_dump(mode="json"))
+    hasher.update(cached["family"])
+    hasher.update(cached["action_srepr"])
+    equations: list[str] = []
+    for equation in cached["equations"]:
+        equations.append(equation)
+        hasher.update(equation)
     return DerivationArtifact(
         run_id=run_id,
         theory_name=theory.name,
         stage="eom",
         equations=equations,
-        canonical_hash=stable_hash(payload),
-        metadata={"family": family, "action_srepr": payload["action_srepr"]},
+        canonical_hash=hasher.hexdigest("physics_ai/derivation/eom"),
+        metadata={"family": cached["family"], "action_srepr": cached["action_srepr"]},
     )
 
 
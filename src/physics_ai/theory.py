@@ -1,23 +1,69 @@
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
 
-from pydantic import ValidationError
-
-from physics_ai.types import TheorySpec
+from physics_ai.types import (
+    CAMPAIGN_VALIDATOR,
+    SCAN_JOB_VALIDATOR,
+    THEORY_VALIDATOR,
+    CampaignSpec,
+    ScanJob,
+    TheorySpec,
+)
 from physics_ai.utils import load_yaml_or_json
 
 
-def load_theory(path: str | Path) -> TheorySpec:
-    file_path = Path(path)
-    payload = load_yaml_or_json(file_path)
-    return TheorySpec.model_validate(payload)
+def load_theory(path: str | Path, trusted: bool = False) -> TheorySpec:
+    """Load and validate a theory, caching the validated spec per file version.
+
+    Callers get a deep copy by default. ``trusted=True`` returns a shallow copy
+    for read-only callers that will not mutate nested fields.
+    """
+    file_path = Path(path).resolve()
+    stat = file_path.stat()
+    cached = _load_validated(str(file_path), stat.st_mtime_ns, stat.st_size)
+    return cached.model_copy() if trusted else cached.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_validated(path_str: str, mtime_ns: int, size: int) -> TheorySpec:
+    return THEORY_VALIDATOR.validate_python(load_yaml_or_json(Path(path_str)))
+
+
+def load_campaign(path: str | Path) -> CampaignSpec:
+    """Load and validate a campaign, caching it per file version like ``load_theory``.
+
+    The seed theory is validated once, in the same pydantic-core pass as the rest of
+    the campaign, and callers always get a deep copy.
+    """
+    file_path = Path(path).resolve()
+    stat = file_path.stat()
+    return _load_validated_campaign(str(file_path), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_validated_campaign(path_str: str, mtime_ns: int, size: int) -> CampaignSpec:
+    return CAMPAIGN_VALIDATOR.validate_python(load_yaml_or_json(Path(path_str)))
+
+
+def load_scan_job(path: str | Path) -> ScanJob:
+    """Load and validate a scan job, caching it per file version like ``load_campaign``."""
+    file_path = Path(path).resolve()
+    stat = file_path.stat()
+    return _load_validated_scan_job(str(file_path), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_validated_scan_job(path_str: str, mtime_ns: int, size: int) -> ScanJob:
+    return SCAN_JOB_VALIDATOR.validate_python(load_yaml_or_json(Path(path_str)))
 
 
 def validate_theory(path: str | Path) -> tuple[bool, str]:
     try:
         theory = load_theory(path)
-    except (ValidationError, ValueError) as exc:
+    except ValueError as exc:  # pydantic.ValidationError subclasses ValueError
         return False, str(exc)
     summary = (
         f"Theory '{theory.name}' validated. fields={len(theory.fields)}, "
@@ -26,12 +72,22 @@ def validate_theory(path: str | Path) -> tuple[bool, str]:
     return True, summary
 
 
+_STRIP_WHITESPACE = str.maketrans("", "", " \t\n")
+# Checked in priority order: an action mentioning both f(R) and GB is still f(R).
+_FAMILY_PATTERNS = (
+    (re.compile(r"f\(r\)|f_r"), "f(R)"),
+    (re.compile(r"einstein-hilbert|r-2\*?lambda"), "GR"),
+    (re.compile(r"gauss-bonnet|gb"), "Einstein-scalar-GB"),
+)
+
+
 def classify_theory_family(theory: TheorySpec) -> str:
-    action = theory.action.lower().replace(" ", "")
-    if "f(r)" in action or "f_r" in action:
-        return "f(R)"
-    if "einstein-hilbert" in action or "r-2*lambda" in action or "r-2lambda" in action:
-        return "GR"
-    if "gauss-bonnet" in action or "gb" in action:
-        return "Einstein-scalar-GB"
+    return _classify_action(theory.action.lower().translate(_STRIP_WHITESPACE))
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_action(action: str) -> str:
+    for pattern, family in _FAMILY_PATTERNS:
+        if pattern.search(action):
+            return family
     return "generic_modified_gravity"
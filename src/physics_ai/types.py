@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Annotated, Any, Self
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Method(str, Enum):
@@ -13,20 +19,66 @@ class Method(str, Enum):
     SPECTRAL = "spectral"
 
 
+class _Record:
+    """Plain slotted records for results the engine builds itself.
+
+    User-facing specs stay Pydantic models; these skip validation on construction.
+    """
+
+    __slots__ = ()
+    # Keys to_dict() adds on top of the dataclass fields; from_dict() drops them.
+    _derived_keys: frozenset[str] = frozenset()
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self, dict_factory=_json_items)  # type: ignore[call-overload]
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> Self:
+        payload = {key: value for key, value in payload.items() if key not in cls._derived_keys}
+        names = {item.name for item in fields(cls)}  # type: ignore[arg-type]
+        unknown = sorted(set(payload) - names)
+        if unknown:
+            raise ValueError(f"Unexpected fields for {cls.__name__}: {', '.join(unknown)}")
+        try:
+            return cls(**payload)
+        except TypeError as exc:
+            raise ValueError(f"Invalid {cls.__name__} payload: {exc}") from exc
+
+
+def _json_items(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    return {key: value.value if isinstance(value, Enum) else value for key, value in items}
+
+
+# Small value specs are immutable once built and reject unknown keys, which also
+# catches typos in theory YAML instead of silently dropping them.
+_VALUE_SPEC_CONFIG = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
+
+# Shared immutable defaults: read-only fields are tuples so models don't allocate a
+# fresh list per instance.
+_DEFAULT_COORDINATES = ("t", "r", "theta", "phi")
+_DEFAULT_SCAN_METHODS = (Method.SHOOTING, Method.WKB, Method.SPECTRAL)
+
+
 class FieldSpec(BaseModel):
+    model_config = _VALUE_SPEC_CONFIG
+
     name: str
     field_type: str = Field(default="scalar")
     spin: int | None = None
 
 
 class SymmetrySpec(BaseModel):
+    model_config = _VALUE_SPEC_CONFIG
+
     name: str
     generators: list[str] = Field(default_factory=list)
 
 
 class AssumptionSet(BaseModel):
+    model_config = _VALUE_SPEC_CONFIG
+
     dimension: int = 4
-    coordinates: list[str] = Field(default_factory=lambda: ["t", "r", "theta", "phi"])
+    coordinates: tuple[str, ...] = _DEFAULT_COORDINATES
     static: bool = True
     spherical: bool = True
     notes: list[str] = Field(default_factory=list)
@@ -49,16 +101,18 @@ class TheorySpec(BaseModel):
         return value
 
 
-class DerivationArtifact(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DerivationArtifact(_Record):
     run_id: str
     theory_name: str
     stage: str
     equations: list[str]
     canonical_hash: str
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
-class BackgroundSystem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class BackgroundSystem(_Record):
     run_id: str
     theory_name: str
     ansatz: str = "static_spherical"
@@ -67,16 +121,19 @@ class BackgroundSystem(BaseModel):
     consistency: dict[str, Any]
 
 
-class PerturbationSystem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PerturbationSystem(_Record):
     run_id: str
     theory_name: str
     family: str = "axial"
     master_equation: str
     effective_potential: str
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class QNMRunConfig(BaseModel):
+    model_config = _VALUE_SPEC_CONFIG
+
     l: int = 2
     n: int = 0
     mass: float = 1.0
@@ -85,44 +142,119 @@ class QNMRunConfig(BaseModel):
     tol: float = 1e-8
 
 
-class QNMResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class QNMResult(_Record):
     run_id: str
     method: Method
     l: int
     n: int
     omega_real: float
     omega_imag: float
-    diagnostics: dict[str, Any] = Field(default_factory=dict)
+    diagnostics: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Solvers pass Method members; only payloads read back from JSON need coercion.
+        if not isinstance(self.method, Method):
+            self.method = Method(self.method)
+
+
+_METHODS_BY_CODE = tuple(Method)
+_METHOD_CODES = {method: code for code, method in enumerate(_METHODS_BY_CODE)}
+_METHOD_VALUES = tuple(method.value for method in _METHODS_BY_CODE)
+
+
+@dataclass(frozen=True, slots=True)
+class QNMBatch:
+    """Struct-of-arrays view of QNM results for vectorized aggregation."""
+
+    run_ids: list[str]
+    method_code: np.ndarray
+    l: np.ndarray
+    n: np.ndarray
+    omega_real: np.ndarray
+    omega_imag: np.ndarray
+    diagnostics: list[dict[str, Any]]
+
+    @classmethod
+    def from_results(cls, results: Iterable[QNMResult]) -> QNMBatch:
+        # NumPy is imported here, not at module level, so importing the schema types
+        # (every CLI command does) stays cheap.
+        import numpy as np
+
+        results = list(results)
+        count = len(results)
+        return cls(
+            run_ids=[result.run_id for result in results],
+            method_code=np.fromiter((_METHOD_CODES[r.method] for r in results), dtype=np.uint8, count=count),
+            l=np.fromiter((result.l for result in results), dtype=np.int16, count=count),
+            n=np.fromiter((result.n for result in results), dtype=np.int16, count=count),
+            omega_real=np.fromiter((result.omega_real for result in results), dtype=np.float64, count=count),
+            omega_imag=np.fromiter((result.omega_imag for result in results), dtype=np.float64, count=count),
+            diagnostics=[result.diagnostics for result in results],
+        )
+
+    @classmethod
+    def coerce(cls, results: QNMBatch | Iterable[QNMResult]) -> QNMBatch:
+        return results if isinstance(results, QNMBatch) else cls.from_results(results)
+
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+    def method_values(self) -> np.ndarray:
+        import numpy as np
+
+        return np.array(_METHOD_VALUES, dtype=object)[self.method_code]
+
+    def iter_results(self) -> Iterator[QNMResult]:
+        columns = zip(
+            self.run_ids,
+            self.method_code.tolist(),
+            self.l.tolist(),
+            self.n.tolist(),
+            self.omega_real.tolist(),
+            self.omega_imag.tolist(),
+            self.diagnostics,
+        )
+        for run_id, code, l, n, omega_real, omega_imag, diagnostics in columns:
+            yield QNMResult(
+                run_id=run_id,
+                method=_METHODS_BY_CODE[code],
+                l=l,
+                n=n,
+                omega_real=omega_real,
+                omega_imag=omega_imag,
+                diagnostics=diagnostics,
+            )
+
+
+# Non-empty grid axes are enforced by pydantic-core while it coerces the floats,
+# rather than by a Python validator walking the grid afterwards.
+_GridAxis = Annotated[list[float], Field(min_length=1)]
 
 
 class ScanJob(BaseModel):
     name: str
     run_id: str
     theory: TheorySpec
-    parameter_grid: dict[str, list[float]] = Field(default_factory=dict)
-    methods: list[Method] = Field(default_factory=lambda: [Method.SHOOTING, Method.WKB, Method.SPECTRAL])
-    l_values: list[int] = Field(default_factory=lambda: [2])
-    n_values: list[int] = Field(default_factory=lambda: [0])
+    parameter_grid: dict[str, _GridAxis] = Field(default_factory=dict)
+    methods: tuple[Method, ...] = _DEFAULT_SCAN_METHODS
+    l_values: tuple[int, ...] = (2,)
+    n_values: tuple[int, ...] = (0,)
 
-    @model_validator(mode="after")
-    def validate_grid(self) -> "ScanJob":
-        for key, values in self.parameter_grid.items():
-            if not values:
-                raise ValueError(f"parameter grid entry '{key}' is empty")
-        return self
 
-
-class ConstraintReport(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ConstraintReport(_Record):
     run_id: str
     is_valid: bool
     ghost_instability: bool
     wrong_sign_kinetic: bool
     divergent_background: bool
-    reasons: list[str] = Field(default_factory=list)
-    metrics: dict[str, float] = Field(default_factory=dict)
+    reasons: list[str] = field(default_factory=list)
+    metrics: dict[str, float] = field(default_factory=dict)
 
 
-class NoveltyNeighbor(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NoveltyNeighbor(_Record):
     identifier: str
     title: str
     concept_similarity: float
@@ -163,9 +295,31 @@ class CampaignSpec(BaseModel):
     max_retries_per_stage: int = 2
 
 
-class EventRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class EventRecord(_Record):
     run_id: str
     stage: str
     status: str
     message: str
-    timestamp: str = Field(default_factory=lambda: datetime.now(tz=timezone.utc).isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    _derived_keys = frozenset({"timestamp"})
+
+    @property
+    def timestamp(self) -> str:
+        """UTC ISO-8601 timestamp, formatted only when an event is actually serialized."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        stamp = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=nanos // 1000)
+        return stamp.isoformat()
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = _Record.to_dict(self)
+        payload["timestamp"] = self.timestamp
+        return payload
+
+
+# Compiled pydantic-core validators for the specs loaded from files, captured once
+# so hot loaders call them directly instead of going through model_validate.
+THEORY_VALIDATOR = TheorySpec.__pydantic_validator__
+CAMPAIGN_VALIDATOR = CampaignSpec.__pydantic_validator__
+SCAN_JOB_VALIDATOR = ScanJob.__pydantic_validator__
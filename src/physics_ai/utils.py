@@ -1,35 +1,167 @@
 from __future__ import annotations
 
+import copy
+import functools
 import hashlib
 import json
-import uuid
-from datetime import datetime, timezone
+import multiprocessing
+import os
+import time
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import blake3  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def generate_run_id(prefix: str = "run") -> str:
-    stamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    token = uuid.uuid4().hex[:8]
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    token = os.urandom(4).hex()
     return f"{prefix}_{stamp}_{token}"
 
 
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for process pools: forked children would inherit the parent's
+    threads and open SQLAlchemy/httpx state, so prefer forkserver, else spawn."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+# json.dumps builds a fresh JSONEncoder whenever any option is non-default; hashing
+# goes through one shared instance instead. Floats are emitted via float.__repr__,
+# which is already the shortest string that round-trips, and NaN/Infinity have no
+# canonical form so they are rejected. orjson is deliberately not used here: its
+# float and non-ASCII output differ from this form, and digests must not depend on
+# which optional packages are installed.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=True,
+    allow_nan=False,
+)
+
+
 def canonical_json(data: Any) -> str:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return _CANONICAL_ENCODER.encode(data)
+
+
+def _canonical_bytes(data: Any) -> bytes:
+    # ensure_ascii output is pure ASCII, so the cheaper codec is exact.
+    return _CANONICAL_ENCODER.encode(data).encode("ascii")
+
+
+def stable_hash(data: Any, algo: str = "sha256") -> str:
+    # sha256 stays the default so stored fingerprints remain comparable; blake3 is
+    # strictly opt-in and never substituted silently, since the digests differ.
+    payload = _canonical_bytes(data)
+    if algo == "sha256":
+        return hashlib.sha256(payload).hexdigest()
+    if algo == "blake3":
+        if blake3 is None:
+            raise RuntimeError("stable_hash(algo='blake3') requires the blake3 package")
+        return blake3.blake3(payload).hexdigest()
+    raise ValueError(f"Unsupported hash algorithm: {algo}")
+
 
+class IncrementalHasher:
+    """Streaming digest over a sequence of canonical JSON records.
 
-def stable_hash(data: Any) -> str:
-    return hashlib.sha256(canonical_json(data).encode("utf-8")).hexdigest()
+    Each record is length-prefixed and terminated by a record separator, and the
+    final digest covers a domain tag, so equal digests imply equal record streams.
+    """
+
+    def __init__(self, algo: str = "sha256") -> None:
+        if algo == "sha256":
+            self._hasher: Any = hashlib.sha256()
+        elif algo == "blake3":
+            if blake3 is None:
+                raise RuntimeError("IncrementalHasher(algo='blake3') requires the blake3 package")
+            self._hasher = blake3.blake3()
+        else:
+            raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+    def update(self, obj: Any) -> None:
+        chunk = _canonical_bytes(obj)
+        self._hasher.update(len(chunk).to_bytes(8, "big"))
+        self._hasher.update(chunk)
+        self._hasher.update(b"\x1e")
+
+    def hexdigest(self, domain: str) -> str:
+        final = self._hasher.copy()
+        final.update(domain.encode("utf-8"))
+        return final.hexdigest()
+
+
+def json_bytes(data: Any, *, sort_keys: bool = False) -> bytes:
+    """Two-space-indented UTF-8 JSON for artifacts and reports; never used for hashing.
+
+    orjson is used when installed. The stdlib fallback mirrors its options: raw UTF-8
+    rather than escapes, NumPy values via ``tolist()``, non-string keys stringified.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    if sort_keys:
+        # Stringify keys first, as orjson does, so mixed key types can be ordered.
+        data = _stringify_keys(data)
+    text = json.dumps(data, indent=2, sort_keys=sort_keys, ensure_ascii=False, default=_json_default)
+    return text.encode("utf-8")
+
+
+def _stringify_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _stringify_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_stringify_keys(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def load_yaml_or_json(path: Path) -> dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
+    # Parsed payloads are cached per file version (mtime and size, so a rewrite
+    # within the filesystem's timestamp granularity is still noticed); callers get
+    # their own deep copy so mutating the result never leaks into the cache.
+    resolved = Path(path).resolve()
+    st = resolved.stat()
+    return copy.deepcopy(_load_cached(str(resolved), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    path = Path(path_str)
+    raw = path.read_bytes()
     if path.suffix.lower() in {".yaml", ".yml"}:
-        parsed = yaml.safe_load(text)
+        parsed = yaml.load(raw, Loader=_SafeLoader)
+    elif orjson is not None:
+        parsed = orjson.loads(raw)
     else:
-        parsed = json.loads(text)
+        parsed = json.loads(raw)
     if not isinstance(parsed, dict):
         raise ValueError(f"Expected mapping at root of {path}")
     return parsed
@@ -37,9 +169,10 @@ def load_yaml_or_json(path: Path) -> dict[str, Any]:
 
 def dump_yaml(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.safe_dump(payload, sort_keys=True), encoding="utf-8")
+    with path.open("wb") as handle:
+        yaml.dump(payload, handle, Dumper=_SafeDumper, sort_keys=True, encoding="utf-8")
 
 
 def dump_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    path.write_bytes(json_bytes(payload, sort_keys=True))
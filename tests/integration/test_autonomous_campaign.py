@@ -1,5 +1,10 @@
+from dataclasses import replace
 from pathlib import Path
 
+from sqlalchemy import select
+
+from physics_ai import orchestrate, storage
+from physics_ai.config import Settings
 from physics_ai.orchestrate import run_autonomous_campaign
 from physics_ai.types import CampaignSpec
 from physics_ai.utils import load_yaml_or_json
@@ -12,3 +17,22 @@ def test_autonomous_campaign_creates_outputs() -> None:
     result = run_autonomous_campaign(spec)
     assert result.accepted_theories >= 1
     assert result.paper_outputs
+
+
+def test_autonomous_campaign_runs_on_in_memory_sqlite(monkeypatch, tmp_path) -> None:
+    settings = replace(Settings(), database_url="sqlite://", artifact_root=tmp_path)
+    monkeypatch.setattr(storage, "get_settings", lambda: settings)
+    engines = []
+
+    def init_db():
+        engines.append(storage.init_db())
+        return engines[-1]
+
+    monkeypatch.setattr(orchestrate, "init_db", init_db)
+    payload = load_yaml_or_json(Path("examples/campaigns/default.yaml"))
+    payload["run_id"] = "integration_memory"
+    result = orchestrate.run_autonomous_campaign(CampaignSpec.model_validate(payload), workers=1)
+    assert result.accepted_theories >= 1
+    with engines[0].connect() as conn:
+        stages = set(conn.execute(select(storage.events_table.c.stage)).scalars())
+    assert {"propose", "finalize"} <= stages
@@ -1,9 +1,16 @@
 from pathlib import Path
 
+import pytest
+
 from physics_ai.background import reduce_to_background_odes
-from physics_ai.perturbation import derive_master_equation
+from physics_ai.perturbation import (
+    derive_master_equation,
+    regge_wheeler_potential,
+    verify_regge_wheeler,
+)
 from physics_ai.symbolic import derive_field_equations
 from physics_ai.theory import load_theory
+from physics_ai.types import BackgroundSystem
 
 
 def test_background_reduction_square_system() -> None:
@@ -20,3 +27,25 @@ def test_regge_wheeler_master_equation_shape() -> None:
     background = reduce_to_background_odes(theory, derivation, run_id="test_pt")
     perturb = derive_master_equation(background, run_id="test_pt")
     assert "omega**2" in perturb.master_equation
+    assert verify_regge_wheeler(perturb)
+
+
+def test_regge_wheeler_potential_string_is_pinned() -> None:
+    assert str(regge_wheeler_potential(mass=1.0, ell=2)) == "(1 - 2.0/r)*(6/r**2 - 6.0/r**3)"
+
+
+def test_fr_background_adds_scalaron_equation() -> None:
+    theory = load_theory(Path("examples/theories/f_r.yaml"))
+    derivation = derive_field_equations(theory, run_id="test_bg_fr")
+    background = reduce_to_background_odes(theory, derivation, run_id="test_bg_fr")
+    assert background.unknown_functions == ["A(r)", "B(r)", "C(r)"]
+    assert background.consistency["square_system"]
+
+
+def test_background_record_round_trips_through_dict() -> None:
+    theory = load_theory(Path("examples/theories/einstein_hilbert.yaml"))
+    artifact = derive_field_equations(theory, run_id="test_roundtrip")
+    background = reduce_to_background_odes(theory, artifact, run_id="test_roundtrip")
+    assert BackgroundSystem.from_dict(background.to_dict()) == background
+    with pytest.raises(ValueError):
+        BackgroundSystem.from_dict({**background.to_dict(), "unexpected": 1})
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from physics_ai.novelty import default_seed_records, score_novelty
+from physics_ai.novelty import CorpusIndex, LiteratureRecord, default_seed_records, score_novelty
 from physics_ai.paper import build_paper
 from physics_ai.types import PaperBuildSpec
 
@@ -17,6 +17,24 @@ def test_novelty_score_in_range() -> None:
     assert report.neighbors
 
 
+def test_corpus_index_shortlist_keeps_nearest_neighbor() -> None:
+    filler = [
+        LiteratureRecord(f"filler{i}", f"Condensed matter topic {i}", "Lattice phonons.", [], {})
+        for i in range(30)
+    ]
+    corpus = filler + default_seed_records()
+    kwargs = {
+        "run_id": "test_index",
+        "hypothesis_text": "Regge-Wheeler axial perturbations of Schwarzschild black holes",
+        "equations": ["d2Psi/dr_*2 + (omega^2 - V_RW)Psi = 0"],
+        "parameters": {"mass": 1.0},
+    }
+    full = score_novelty(corpus=corpus, **kwargs)
+    shortlisted = score_novelty(index=CorpusIndex(corpus), candidates=5, **kwargs)
+    assert shortlisted.neighbors[0] == full.neighbors[0]
+    assert shortlisted.novelty_score == full.novelty_score
+
+
 def test_paper_builder_writes_latex_and_markdown(tmp_path: Path) -> None:
     report = score_novelty(
         run_id="test_paper",
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from physics_ai.novelty_index import InMemoryVectorIndex, MMapVectorIndex
+
+
+def test_in_memory_index_returns_best_matches_first() -> None:
+    index = InMemoryVectorIndex()
+    index.add(np.array([1.0, 0.0, 0.0]), {"id": "x"})
+    index.add(np.array([0.0, 1.0, 0.0]), {"id": "y"})
+    index.add(np.array([1.0, 1.0, 0.0]), {"id": "xy"})
+    hits = index.search(np.array([1.0, 0.1, 0.0]), top_k=2)
+    assert [hit["id"] for hit in hits] == ["x", "xy"]
+    assert hits[0]["score"] >= hits[1]["score"]
+    index.add(np.array([1.0, 0.1, 0.0]), {"id": "exact"})
+    assert index.search(np.array([1.0, 0.1, 0.0]), top_k=10)[0]["id"] == "exact"
+
+
+def test_mmap_index_grows_and_reopens(tmp_path) -> None:
+    base = tmp_path / "corpus"
+    index = MMapVectorIndex(base, dim=3, capacity=1)
+    index.add(np.array([1.0, 0.0, 0.0]), {"id": "x"})
+    index.add(np.array([0.0, 1.0, 0.0]), {"id": "y"})
+    index.add(np.array([1.0, 1.0, 0.0]), {"id": "xy"})
+    index.close()
+    with MMapVectorIndex(base, dim=3) as reopened:
+        assert len(reopened) == 3
+        hits = reopened.search(np.array([1.0, 0.1, 0.0]), top_k=2)
+        assert [hit["id"] for hit in hits] == ["x", "xy"]
+
+
+def test_mmap_index_rejects_a_second_owner(tmp_path) -> None:
+    base = tmp_path / "corpus"
+    with MMapVectorIndex(base, dim=3), pytest.raises(RuntimeError, match="already open"):
+        MMapVectorIndex(base, dim=3)
+    with MMapVectorIndex(base, dim=3) as reopened:
+        assert len(reopened) == 0
+
+
+def test_mmap_index_rejects_mismatched_vector_file(tmp_path) -> None:
+    base = tmp_path / "corpus"
+    with MMapVectorIndex(base, dim=3, capacity=2) as index:
+        index.add(np.array([1.0, 0.0, 0.0]), {"id": "x"})
+    with pytest.raises(ValueError, match="whole number"):
+        MMapVectorIndex(base, dim=4)
+    (tmp_path / "corpus.vec").write_bytes(b"")
+    with pytest.raises(ValueError, match="lists 1"):
+        MMapVectorIndex(base, dim=3)
+    # A failed open must release the lock for the next owner.
+    (tmp_path / "corpus.meta.jsonl").write_text("")
+    with MMapVectorIndex(base, dim=3) as reopened:
+        assert len(reopened) == 0
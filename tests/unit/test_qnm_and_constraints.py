@@ -1,8 +1,18 @@
 from pathlib import Path
 
 from physics_ai.physics_rules import evaluate_constraints
-from physics_ai.qnm import Method, QNMRunConfig, compare_methods, solve_qnm
+from physics_ai.qnm import (
+    Method,
+    QNMRunConfig,
+    compare_methods,
+    eikonal_seed,
+    eikonal_seed_array,
+    solve_qnm,
+    solve_qnm_batch,
+    solve_qnm_methods,
+)
 from physics_ai.theory import load_theory
+from physics_ai.types import QNMBatch
 
 
 def test_qnm_methods_are_close() -> None:
@@ -16,9 +26,46 @@ def test_qnm_methods_are_close() -> None:
     assert report.is_consistent
 
 
+def test_qnm_batch_matches_single_solves() -> None:
+    configs = [QNMRunConfig(l=l, n=n, mass=1.0) for l in (2, 3) for n in (0, 1)]
+    batch = solve_qnm_batch(configs, run_id="test_batch", method=Method.WKB)
+    single = [solve_qnm(config, run_id="test_batch", method=Method.WKB) for config in configs]
+    assert batch == single
+
+
+def test_qnm_methods_match_single_solves() -> None:
+    config = QNMRunConfig(l=3, n=1, mass=0.8)
+    methods = [Method.SHOOTING, Method.WKB, Method.SPECTRAL]
+    single = [solve_qnm(config, run_id="test_methods", method=method) for method in methods]
+    assert solve_qnm_methods(config, "test_methods", methods) == single
+
+
+def test_eikonal_seed_array_matches_scalar_seeds() -> None:
+    ls, ns, masses = [2, 3, 4], [0, 1, 2], [1.0, 0.7, 2.5]
+    seeds = eikonal_seed_array(ls, ns, masses)
+    assert seeds.tolist() == [eikonal_seed(l, n, m) for l, n, m in zip(ls, ns, masses)]
+
+
 def test_constraint_filter_flags_wrong_sign_kinetic() -> None:
     theory = load_theory(Path("examples/theories/einstein_hilbert.yaml"))
     theory.parameters["kinetic_coeff"] = -1.0
     report = evaluate_constraints("test_constraints", theory, qnm_results=[])
     assert not report.is_valid
     assert report.wrong_sign_kinetic
+
+
+def test_constraint_filter_accepts_one_shot_qnm_iterator() -> None:
+    theory = load_theory(Path("examples/theories/einstein_hilbert.yaml"))
+    config = QNMRunConfig(l=2, n=0, mass=1.0)
+    results = (solve_qnm(config, run_id="test_iter", method=method) for method in Method)
+    report = evaluate_constraints("test_iter", theory, qnm_results=results)
+    assert report.is_valid
+    assert report.metrics["max_omega_imag"] < 0
+
+
+def test_qnm_batch_round_trips_and_matches_list_aggregation() -> None:
+    configs = [QNMRunConfig(l=l, n=n, mass=1.0) for l in (2, 3) for n in (0, 1)]
+    results = [r for method in Method for r in solve_qnm_batch(configs, run_id="test_batch", method=method)]
+    batch = QNMBatch.from_results(results)
+    assert list(batch.iter_results()) == results
+    assert compare_methods(batch) == compare_methods(results)
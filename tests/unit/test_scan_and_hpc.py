@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from physics_ai.explore import run_scan
+from physics_ai.hpc import SlurmJobSpec, render_slurm_script
+from physics_ai.types import ScanJob
+from physics_ai.utils import load_yaml_or_json
+
+
+def test_scan_shards_partition_the_grid() -> None:
+    job = ScanJob.model_validate(load_yaml_or_json(Path("examples/scan.yaml")))
+    full = run_scan(job, workers=1)
+    shards = [run_scan(job, workers=1, shard=index, shards=4) for index in range(4)]
+    combined = pd.concat(shards, ignore_index=True)
+    keys = ["alpha", "beta", "method", "l", "n"]
+    pd.testing.assert_frame_equal(
+        combined.sort_values(keys).reset_index(drop=True),
+        full.sort_values(keys).reset_index(drop=True),
+    )
+
+
+def test_slurm_array_script_shards_the_scan() -> None:
+    spec = SlurmJobSpec(job_name="scan", command="physai run scan scan.yaml", array_size=8, array_concurrency=2)
+    script = render_slurm_script(spec)
+    assert "#SBATCH --array=0-7%2" in script
+    assert script.endswith("physai run scan scan.yaml --shard $SLURM_ARRAY_TASK_ID --shards 8")
+
+
+def test_scan_job_rejects_empty_grid_axis() -> None:
+    payload = load_yaml_or_json(Path("examples/scan.yaml"))
+    payload["parameter_grid"]["alpha"] = []
+    with pytest.raises(ValidationError):
+        ScanJob.model_validate(payload)
+
+
+def test_distributed_scan_keeps_duplicate_grid_points() -> None:
+    pytest.importorskip("dask.distributed")
+    from physics_ai.distributed import run_scan_distributed
+
+    payload = load_yaml_or_json(Path("examples/scan.yaml"))
+    payload["parameter_grid"] = {"alpha": [1.0, 1.0, 2.0]}
+    frame = run_scan_distributed(ScanJob.model_validate(payload), workers=1)
+    assert frame["alpha"].tolist() == [1.0, 1.0, 2.0]
+
+
+def test_scan_process_pool_matches_in_process_run() -> None:
+    job = ScanJob.model_validate(load_yaml_or_json(Path("examples/scan.yaml")))
+    pd.testing.assert_frame_equal(run_scan(job, workers=2), run_scan(job))
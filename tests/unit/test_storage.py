@@ -0,0 +1,110 @@
+import json
+import zipfile
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+
+from physics_ai import storage
+from physics_ai.config import Settings
+from physics_ai.storage import (
+    EventLogger,
+    TransactionBuffer,
+    events_table,
+    flush_artifacts,
+    init_db,
+    theories_table,
+    write_archived_artifact,
+    write_artifact,
+    write_json_artifact,
+)
+from physics_ai.types import EventRecord
+from physics_ai.utils import json_bytes
+
+
+def test_transaction_buffer_writes_rows_on_exit() -> None:
+    engine = init_db(create_engine("sqlite://", future=True))
+    with TransactionBuffer(engine) as buffer:
+        buffer.append(theories_table, {"run_id": "r", "name": "t", "payload": {}})
+        for status in ("ok", "rejected"):
+            buffer.append(events_table, {"run_id": "r", "stage": "s", "status": status, "message": "", "payload": {}})
+        with engine.connect() as conn:
+            assert conn.execute(select(func.count()).select_from(events_table)).scalar_one() == 0
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(events_table)).scalar_one() == 2
+        assert conn.execute(select(theories_table.c.name)).scalar_one() == "t"
+
+
+def test_event_logger_drains_queue_on_close(tmp_path) -> None:
+    engine = init_db(create_engine(f"sqlite:///{tmp_path / 'events.db'}", future=True))
+    with EventLogger(engine, batch_size=4) as logger:
+        for index in range(10):
+            logger.log({"run_id": "r", "stage": "s", "status": "ok", "message": str(index), "payload": {}})
+    with engine.connect() as conn:
+        messages = conn.execute(select(events_table.c.message).order_by(events_table.c.id)).scalars().all()
+    assert messages == [str(index) for index in range(10)]
+
+
+@pytest.fixture
+def artifact_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(storage, "get_settings", lambda: replace(Settings(), artifact_root=tmp_path))
+    yield tmp_path
+    flush_artifacts()
+
+
+def test_write_artifact_returns_the_written_file(artifact_root: Path) -> None:
+    path = write_artifact("run", "perturb", "master.txt", "old")
+    assert write_artifact("run", "perturb", "master.txt", "new") == path
+    assert path == artifact_root / "run" / "perturb" / "master.txt"
+    assert path.read_text(encoding="utf-8") == "new"
+    assert json.loads(write_json_artifact("run", "derive", "eom.json", {"b": 1, "a": 2}).read_bytes()) == {
+        "a": 2,
+        "b": 1,
+    }
+
+
+def test_archived_artifacts_share_one_zip_and_overwrite_duplicates(artifact_root: Path) -> None:
+    archive = artifact_root / "run" / "artifacts.zip"
+    locator = write_archived_artifact("run", "perturb", "master.txt", "first")
+    assert locator == archive / "perturb" / "master.txt"
+    write_archived_artifact("run", "derive", "eom.json", b"{}")
+    write_archived_artifact("run", "perturb", "master.txt", "second")
+    flush_artifacts("run")
+    with zipfile.ZipFile(archive) as store:
+        assert sorted(store.namelist()) == ["derive/eom.json", "perturb/master.txt"]
+        assert store.read("perturb/master.txt") == b"second"
+    # A later run under the same id starts a fresh archive instead of appending.
+    write_archived_artifact("run", "perturb", "master.txt", "rerun")
+    flush_artifacts("run")
+    with zipfile.ZipFile(archive) as store:
+        assert store.namelist() == ["perturb/master.txt"]
+        assert store.read("perturb/master.txt") == b"rerun"
+
+
+def test_event_record_formats_timestamp_on_serialization() -> None:
+    event = EventRecord(run_id="r", stage="s", status="ok", message="m", timestamp_ns=1_700_000_000_123_456_789)
+    payload = event.to_dict()
+    assert payload["timestamp"] == "2023-11-14T22:13:20.123456+00:00"
+    assert EventRecord.from_dict(payload) == event
+
+
+def test_event_logger_does_not_mask_the_body_exception() -> None:
+    engine = create_engine("sqlite://", future=True)  # no tables, so every write fails
+    row = {"run_id": "r", "stage": "s", "status": "ok", "message": "m", "payload": {}}
+    with pytest.raises(RuntimeError, match="proposal failed"), EventLogger(engine) as logger:
+        logger.log(row)
+        raise RuntimeError("proposal failed")
+    with pytest.raises(OperationalError), EventLogger(engine) as logger:
+        logger.log(row)
+
+
+def test_json_bytes_sorts_on_request_and_handles_numpy_and_unicode() -> None:
+    payload = {"b": np.arange(2), "a": "Ω", 3: np.float64(0.5)}
+    assert json.loads(json_bytes(payload)) == {"b": [0, 1], "a": "Ω", "3": 0.5}
+    encoded = json_bytes(payload, sort_keys=True)
+    assert "Ω".encode() in encoded
+    assert list(json.loads(encoded)) == ["3", "a", "b"]
@@ -1,7 +1,16 @@
 from pathlib import Path
 
-from physics_ai.symbolic import derive_field_equations, verify_fr_baseline, verify_gr_baseline
+import pytest
+
+from physics_ai import symbolic
+from physics_ai.symbolic import (
+    derivation_input_hash,
+    derive_field_equations,
+    verify_fr_baseline,
+    verify_gr_baseline,
+)
 from physics_ai.theory import load_theory
+from physics_ai.utils import IncrementalHasher, canonical_json, stable_hash
 
 
 def test_einstein_hilbert_derivation_contains_gr_equation() -> None:
@@ -16,3 +25,30 @@ def test_fr_derivation_contains_fr_signature() -> None:
     artifact = derive_field_equations(theory, run_id="test_fr")
     assert verify_fr_baseline(artifact)
     assert artifact.metadata["family"] == "f(R)"
+
+
+def test_incremental_hasher_separates_records() -> None:
+    def digest(*records: str) -> str:
+        hasher = IncrementalHasher()
+        for record in records:
+            hasher.update(record)
+        return hasher.hexdigest("test")
+
+    assert digest("ab", "c") == digest("ab", "c")
+    assert digest("ab", "c") != digest("a", "bc")
+    assert digest("ab") != digest("ab", "")
+
+
+def test_stable_hash_is_pinned_and_rejects_non_finite_floats() -> None:
+    payload = {"b": [0.1, 1e-05, 1e22, -0.0, 3], "a": "Ω", "c": {"x": None, "y": True}}
+    assert canonical_json(payload) == '{"a":"\\u03a9","b":[0.1,1e-05,1e+22,-0.0,3],"c":{"x":null,"y":true}}'
+    assert stable_hash(payload) == "82ea306d8567c95cf3c9d4e7a7530c6f1e9cc2932178fc03a30c08afe5a93e72"
+    with pytest.raises(ValueError):
+        stable_hash({"x": float("nan")})
+
+
+def test_derivation_cache_key_changes_with_version(monkeypatch) -> None:
+    key = derivation_input_hash("R^2", {"alpha": 1.0})
+    assert key == derivation_input_hash("R**2", {"alpha": 1.0})
+    monkeypatch.setattr(symbolic, "DERIVATION_CACHE_VERSION", symbolic.DERIVATION_CACHE_VERSION + 1)
+    assert derivation_input_hash("R^2", {"alpha": 1.0}) != key
@@ -1,6 +1,18 @@
+import os
 from pathlib import Path
 
-from physics_ai.theory import classify_theory_family, load_theory, validate_theory
+import pytest
+from pydantic import ValidationError
+
+from physics_ai.theory import (
+    classify_theory_family,
+    load_campaign,
+    load_scan_job,
+    load_theory,
+    validate_theory,
+)
+from physics_ai.types import CampaignSpec, FieldSpec
+from physics_ai.utils import load_yaml_or_json
 
 
 def test_validate_theory_ok() -> None:
@@ -14,3 +26,45 @@ def test_classify_families() -> None:
     fr = load_theory(Path("examples/theories/f_r.yaml"))
     assert classify_theory_family(gr) == "GR"
     assert classify_theory_family(fr) == "f(R)"
+
+
+def test_load_theory_returns_independent_copies() -> None:
+    path = Path("examples/theories/einstein_hilbert.yaml")
+    first = load_theory(path)
+    first.parameters["kinetic_coeff"] = -1.0
+    assert load_theory(path).parameters["kinetic_coeff"] == 1.0
+
+
+def test_load_yaml_or_json_sees_same_mtime_rewrites(tmp_path: Path) -> None:
+    path = tmp_path / "payload.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    stamp = path.stat().st_mtime_ns
+    assert load_yaml_or_json(path) == {"a": 1}
+    path.write_text('{"a": 10}', encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    assert load_yaml_or_json(path) == {"a": 10}
+
+
+def test_value_specs_are_frozen_and_reject_unknown_keys() -> None:
+    with pytest.raises(ValidationError):
+        FieldSpec(name="phi", feild_type="scalar")
+    spec = FieldSpec(name="phi")
+    with pytest.raises(ValidationError):
+        spec.name = "psi"
+
+
+def test_load_campaign_returns_independent_copies_and_reuses_theories() -> None:
+    path = Path("examples/campaigns/default.yaml")
+    first = load_campaign(path)
+    first.seed_theory.parameters["mass"] = 5.0
+    second = load_campaign(path)
+    assert second.seed_theory.parameters["mass"] == 1.0
+    rebuilt = CampaignSpec(name="c", run_id="r", seed_theory=second.seed_theory)
+    assert rebuilt.seed_theory is second.seed_theory
+
+
+def test_load_scan_job_returns_independent_copies() -> None:
+    path = Path("examples/scan.yaml")
+    first = load_scan_job(path)
+    first.theory.parameters["mass"] = 5.0
+    assert load_scan_job(path).theory.parameters == load_yaml_or_json(path)["theory"]["parameters"]